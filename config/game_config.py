@@ -37,9 +37,12 @@ AGENT_SPEED = 1.5
 AGENT_SIZE = 12
 AGENT_VISION_RANGE = 90
 AGENT_COMMUNICATION_RANGE = 300
+AGENT_VISION_RANGE_SQ = AGENT_VISION_RANGE ** 2
+AGENT_COMMUNICATION_RANGE_SQ = AGENT_COMMUNICATION_RANGE ** 2
 
 # ============ ROLE-SPECIFIC VISION RANGES ============
 COLLECTOR_VISION_RANGE = 30  # Collectors have very limited vision range
+COLLECTOR_VISION_RANGE_SQ = COLLECTOR_VISION_RANGE ** 2
 
 # ============ RESOURCE SETTINGS ============
 RESOURCE_SIZE = 8
@@ -67,6 +70,7 @@ HIDEOUT_Y = WINDOW_HEIGHT - 100
 # ============ GAME MECHANICS ============
 WINNING_RESOURCES_FOR_THIEF = RESOURCES_INITIAL_COUNT  # Steal all to win
 CATCHING_DISTANCE = 15  # Pixels to catch thief
+CATCHING_DISTANCE_SQ = CATCHING_DISTANCE ** 2
 
 # ============ AGENT ROLES ============
 AGENT_ROLE_EXPLORER = "explorer"
@@ -2,9 +2,21 @@
 Attacker Agent
 Pursues and attempts to capture the thief
 """
+import math
+import random
 from config.game_config import *
 from src.agents.base_agent import BaseAgent
-from src.utils.helpers import distance, move_towards
+from src.communication.blackboard import AttackerThiefSpottedPayload, ThiefCaughtPayload
+from src.utils.helpers import TAU
+
+
+# Waypoints on the defensive circle around base camp
+_PATROL_RADIUS = 100
+_PATROL_RING = [
+    (BASE_CAMP_X + _PATROL_RADIUS * math.cos(TAU * i / 64),
+     BASE_CAMP_Y + _PATROL_RADIUS * math.sin(TAU * i / 64))
+    for i in range(64)
+]
 
 
 class AttackerAgent(BaseAgent):
@@ -26,6 +38,12 @@ class AttackerAgent(BaseAgent):
         self.pursuit_cooldown = 0
         self.is_pursuing = False
         self.is_active = False  # Attacker not active until thief detected
+        
+        # Message type -> handler, looked up once per message
+        self._msg_handlers = {
+            "thief_sighted": self._on_thief_sighted,
+            "intercept_command": self._on_intercept,
+        }
     
     def think(self) -> None:
         """Attacker decision-making logic"""
@@ -49,7 +67,6 @@ class AttackerAgent(BaseAgent):
             self._patrol_base_defense()
         else:
             # Not active - stay near base camp
-            from config.game_config import BASE_CAMP_X, BASE_CAMP_Y
             self.set_target(BASE_CAMP_X, BASE_CAMP_Y, MOVEMENT_PATROL)
     
     def check_and_pursue_thief(self, thief_x: float, thief_y: float, thief_visible: bool) -> bool:
@@ -75,10 +92,8 @@ class AttackerAgent(BaseAgent):
             self.set_target(thief_x, thief_y, MOVEMENT_PURSUE)
             
             # Report sighting to team
-            self.broadcast_message("attacker_thief_spotted", {
-                "attacker_id": self.id,
-                "position": (thief_x, thief_y)
-            })
+            self.broadcast_message("attacker_thief_spotted",
+                                   AttackerThiefSpottedPayload(self.id, (thief_x, thief_y)))
             
             return True
         return False
@@ -89,19 +104,17 @@ class AttackerAgent(BaseAgent):
             return
         
         self.last_known_thief_position = self.thief_position
+        tx, ty = self.thief_position
+        dx = tx - self.x
+        dy = ty - self.y
         
         # Check if in catching range
-        dist_to_thief = distance(self.get_position(), self.thief_position)
-        
-        if dist_to_thief < CATCHING_DISTANCE:
+        if dx * dx + dy * dy < CATCHING_DISTANCE_SQ:
             # Caught the thief!
-            self.broadcast_message("thief_caught", {
-                "attacker_id": self.id,
-                "thief_position": self.thief_position
-            })
+            self.broadcast_message("thief_caught", ThiefCaughtPayload(self.id, tx, ty))
         else:
             # Move towards thief
-            self.set_target(self.thief_position[0], self.thief_position[1], MOVEMENT_PURSUE)
+            self.set_target(tx, ty, MOVEMENT_PURSUE)
     
     def _move_to_last_known_position(self) -> None:
         """Move to last known thief position"""
@@ -109,7 +122,8 @@ class AttackerAgent(BaseAgent):
             return
         
         # Check if reached position
-        if distance(self.get_position(), self.last_known_thief_position) < 20:
+        lx, ly = self.last_known_thief_position
+        if (lx - self.x) ** 2 + (ly - self.y) ** 2 < 400:
             self.last_known_thief_position = None
         else:
             self.set_target(self.last_known_thief_position[0],
@@ -117,35 +131,33 @@ class AttackerAgent(BaseAgent):
     
     def _patrol_base_defense(self) -> None:
         """Patrol around base camp for defense"""
-        import random
-        from config.game_config import BASE_CAMP_X, BASE_CAMP_Y
-        
-        if self.target_position is None or distance(self.get_position(), self.target_position) < 20:
-            # Pick random position around base
-            angle = random.uniform(0, 2 * 3.14159)
-            radius = 100
-            import math
-            target_x = BASE_CAMP_X + radius * math.cos(angle)
-            target_y = BASE_CAMP_Y + radius * math.sin(angle)
+        target = self.target_position
+        if target is None or (target[0] - self.x) ** 2 + (target[1] - self.y) ** 2 < 400:
+            # Pick random waypoint around base
+            target_x, target_y = _PATROL_RING[random.randrange(64)]
             self.set_target(target_x, target_y, MOVEMENT_PATROL)
     
     def _process_messages(self) -> None:
         """Process incoming messages"""
-        messages = self.get_messages()
-        for message in messages:
-            if message.message_type == "thief_sighted":
-                content = message.content
-                if "position" in content:
-                    self.thief_position = tuple(content["position"])
-                    self.last_known_thief_position = self.thief_position
-                    self.is_active = True  # Activate attacker when thief spotted
-            elif message.message_type == "intercept_command":
-                # Strategist gave interception command
-                content = message.content
-                if "target_position" in content:
-                    self.is_active = True  # Activate attacker
-                    self.set_target(content["target_position"][0],
-                                  content["target_position"][1], MOVEMENT_PURSUE)
+        handlers = self._msg_handlers
+        for message in self.get_messages():
+            handler = handlers.get(message.message_type)
+            if handler:
+                handler(message.content)
+    
+    def _on_thief_sighted(self, content) -> None:
+        """Handle a thief sighting report"""
+        if content.position:
+            self.thief_position = tuple(content.position)
+            self.last_known_thief_position = self.thief_position
+            self.is_active = True  # Activate attacker when thief spotted
+    
+    def _on_intercept(self, content) -> None:
+        """Handle an interception command from the strategist"""
+        if content.target_position:
+            self.is_active = True  # Activate attacker
+            self.set_target(content.target_position[0],
+                          content.target_position[1], MOVEMENT_PURSUE)
     
     def check_thief_collision(self, player_x: float, player_y: float, player_size: float) -> bool:
         """
@@ -159,5 +171,7 @@ class AttackerAgent(BaseAgent):
         Returns:
             True if thief is caught
         """
-        dist = distance(self.get_position(), (player_x, player_y))
-        return dist < (self.size + player_size + CATCHING_DISTANCE)
+        catch_range = self.size + player_size + CATCHING_DISTANCE
+        dx = player_x - self.x
+        dy = player_y - self.y
+        return dx * dx + dy * dy < catch_range * catch_range
@@ -3,16 +3,71 @@ Base Agent Class
 Foundation for all agent types with common functionality
 """
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Tuple, Optional
+import math
+import random
+import numpy as np
 import pygame
 from config.game_config import *
-from src.utils.helpers import distance, clamp_position, move_towards, random_direction
+from src.utils.helpers import TAU, distance_sq, clamp_position, move_towards_xy, random_direction
+from src.utils.steering import STEER_OFFSETS, best_candidate
 from src.communication.blackboard import get_blackboard, Message
 
 
+# Random draws for patrol retargeting are made this many at a time
+_RANDOM_BATCH = 64
+
+
+class ObstacleArrayCache:
+    """Obstacle bounds packed into NumPy columns for vectorized collision tests"""
+    
+    def __init__(self):
+        """Initialize an empty cache"""
+        self.source = None
+        self.count = 0
+        self.x0 = self.y0 = self.x1 = self.y1 = np.empty(0)
+    
+    def refresh(self, obstacles) -> None:
+        """
+        Rebuild the bound arrays from a list of obstacles
+        
+        Args:
+            obstacles: List of obstacles
+        """
+        bounds = np.array([(obs.x, obs.y, obs.x + obs.width, obs.y + obs.height)
+                           for obs in obstacles], dtype=np.float64).reshape(-1, 4)
+        self.x0, self.y0, self.x1, self.y1 = (np.ascontiguousarray(col) for col in bounds.T)
+        self.source = obstacles
+        self.count = len(obstacles)
+    
+    def get(self, obstacles) -> 'ObstacleArrayCache':
+        """Return the cache, rebuilding it first if it was built from another list"""
+        if obstacles is not self.source or len(obstacles) != self.count:
+            self.refresh(obstacles)
+        return self
+
+
+# Shared by all agents; the game engine refreshes it once the map is built
+obstacle_cache = ObstacleArrayCache()
+_NO_OBSTACLES = ObstacleArrayCache()  # Stays empty; used when no obstacles are passed
+
+
 class BaseAgent(ABC):
     """Base class for all agents"""
     
+    # Body color per role
+    _ROLE_COLORS = {
+        AGENT_ROLE_EXPLORER: COLOR_BLUE,
+        AGENT_ROLE_COLLECTOR: COLOR_GREEN,
+        AGENT_ROLE_ATTACKER: COLOR_RED,
+        AGENT_ROLE_STRATEGIST: COLOR_MAGENTA,
+    }
+    
+    # Shared label font and rendered role glyphs, created on first draw
+    _label_font = None
+    _role_label_cache = {}
+    
     def __init__(self, agent_id: str, role: str, x: float, y: float):
         """
         Initialize a base agent
@@ -27,33 +82,47 @@ class BaseAgent(ABC):
         self.role = role
         self.x = x
         self.y = y
+        self.ix = int(x)  # Integer pixel position for drawing
+        self.iy = int(y)
         self.speed = AGENT_SPEED
         self.size = AGENT_SIZE
         
         # Set vision range based on role
         if role == AGENT_ROLE_COLLECTOR:
             self.vision_range = COLLECTOR_VISION_RANGE
+            self.vision_range_sq = COLLECTOR_VISION_RANGE_SQ
         else:
             self.vision_range = AGENT_VISION_RANGE
+            self.vision_range_sq = AGENT_VISION_RANGE_SQ
             
         self.communication_range = AGENT_COMMUNICATION_RANGE
+        self.communication_range_sq = AGENT_COMMUNICATION_RANGE_SQ
         
         # Movement state
         self.vx = 0
         self.vy = 0
         self.target_position: Optional[Tuple[float, float]] = None
         self.movement_type = MOVEMENT_PATROL
-        self.last_positions = []  # Track last positions to detect stuck state
+        self.last_positions = deque(maxlen=30)  # Track last positions to detect stuck state
         self.stuck_counter = 0
+        self._last_deflect_sign = 1  # Side (+1 / -1) of the last successful steering turn
+        
+        # Pre-drawn uniform [0, 1) pairs, consumed one per patrol retarget; the
+        # generator is seeded from `random` so random.seed() still reproduces a game
+        self._rng = np.random.default_rng(random.getrandbits(64))
+        self._random_pairs = []
+        self._random_index = 0
         
         # State
         self.active = True
-        self.carrying = []  # For collector agents
+        self.carrying_count = 0  # For collector agents
+        self.carrying_value = 0.0
         self.energy = 100
         self.max_energy = 100
         
         # Communication
         self.blackboard = get_blackboard()
+        self.blackboard.register_inbox(self.id)
         self.messages = []
         
         # Debug
@@ -63,9 +132,15 @@ class BaseAgent(ABC):
         """Get agent position"""
         return (self.x, self.y)
     
+    # Hot-path methods below bind module constants and helpers as keyword-only
+    # defaults so they are read as fast locals instead of global lookups
+    
     def set_position(self, x: float, y: float) -> None:
-        """Set agent position"""
-        self.x, self.y = clamp_position((x, y), WINDOW_WIDTH, WINDOW_HEIGHT)
+        """Set agent position, clamped to the window"""
+        self.x = 0 if x < 0 else (WINDOW_WIDTH if x > WINDOW_WIDTH else x)
+        self.y = 0 if y < 0 else (WINDOW_HEIGHT if y > WINDOW_HEIGHT else y)
+        self.ix = int(self.x)
+        self.iy = int(self.y)
     
     def set_target(self, target_x: float, target_y: float, movement_type: str = MOVEMENT_PATROL) -> None:
         """
@@ -89,24 +164,27 @@ class BaseAgent(ABC):
         if not self.target_position or not self.active:
             return
         
-        current = self.get_position()
+        x, y = self.x, self.y
         target = self.target_position
-        dist_to_target = distance(current, target)
+        tx, ty = target
+        arrive_dist = self.speed + 5
         
         # Check if reached target (with proper tolerance)
-        if dist_to_target < self.speed + 5:
+        dx = tx - x
+        dy = ty - y
+        if dx * dx + dy * dy < arrive_dist * arrive_dist:
             # Move exactly to target for final smoothness
-            self.set_position(target[0], target[1])
+            self.set_position(tx, ty)
             self.target_position = None
             return
         
         # Calculate desired movement
-        desired_pos = move_towards(current, target, self.speed)
+        desired_pos = move_towards_xy(x, y, tx, ty, self.speed)
         
         # Check if desired position is blocked
         if self._is_position_blocked(desired_pos, obstacles):
             # Use steering to navigate around obstacle
-            best_pos = self._find_best_path(current, target, obstacles)
+            best_pos = self._find_best_path((x, y), target, obstacles)
             # Smooth the movement - use the found path
             self.set_position(best_pos[0], best_pos[1])
         else:
@@ -120,8 +198,13 @@ class BaseAgent(ABC):
         
         # Check with larger buffer to detect walls even earlier
         buffer = self.size + 20  # Increased from 15 to 20
+        
+        x, y = pos
         for obs in obstacles:
-            if obs.contains_circle(pos[0], pos[1], buffer):
+            # Cheap bounding-box rejection before the exact circle test
+            if x + buffer < obs.x or x - buffer > obs.x2 or y + buffer < obs.y or y - buffer > obs.y2:
+                continue
+            if obs.contains_circle(x, y, buffer):
                 return True
         
         return False
@@ -130,6 +213,9 @@ class BaseAgent(ABC):
         """
         Find the best path around obstacles using steering (smooth version)
         
+        The candidate scoring itself runs in src.utils.steering; the first
+        clear candidate in order of preference wins.
+        
         Args:
             current: Current position
             target: Target position
@@ -138,51 +224,31 @@ class BaseAgent(ABC):
         Returns:
             Best position to move to
         """
-        import math
-        
-        # Calculate angle to target
-        angle_to_target = math.atan2(target[1] - current[1], target[0] - current[0])
-        
-        # First try: straight ahead (no deviation)
-        test_x = current[0] + math.cos(angle_to_target) * self.speed
-        test_y = current[1] + math.sin(angle_to_target) * self.speed
-        test_pos = clamp_position((test_x, test_y), WINDOW_WIDTH, WINDOW_HEIGHT)
-        
-        if not self._is_position_blocked(test_pos, obstacles):
-            return test_pos
-        
-        # Second: try angles in increasing steps (smoother turning)
-        # Check both left and right, alternating for smooth curves
-        for offset in [15, -15, 30, -30, 45, -45, 60, -60, 75, -75, 90, -90]:
-            test_angle = angle_to_target + math.radians(offset)
-            test_x = current[0] + math.cos(test_angle) * self.speed
-            test_y = current[1] + math.sin(test_angle) * self.speed
-            test_pos = clamp_position((test_x, test_y), WINDOW_WIDTH, WINDOW_HEIGHT)
-            
-            if not self._is_position_blocked(test_pos, obstacles):
-                return test_pos
-        
-        # Third: try strafe movement (lateral dodge)
-        for strafe_angle in [120, -120, 135, -135, 150, -150]:
-            test_angle = angle_to_target + math.radians(strafe_angle)
-            test_x = current[0] + math.cos(test_angle) * self.speed * 0.6
-            test_y = current[1] + math.sin(test_angle) * self.speed * 0.6
-            test_pos = clamp_position((test_x, test_y), WINDOW_WIDTH, WINDOW_HEIGHT)
-            
-            if not self._is_position_blocked(test_pos, obstacles):
-                return test_pos
-        
-        # Fourth: try backward escape
-        for back_mult in [0.6, 0.4, 0.2]:
-            backward_x = current[0] - math.cos(angle_to_target) * self.speed * back_mult
-            backward_y = current[1] - math.sin(angle_to_target) * self.speed * back_mult
-            backward_pos = clamp_position((backward_x, backward_y), WINDOW_WIDTH, WINDOW_HEIGHT)
-            
-            if not self._is_position_blocked(backward_pos, obstacles):
-                return backward_pos
-        
-        # Last resort: stay in place
-        return current
+        # Same circle-vs-rectangle test as _is_position_blocked
+        obs = obstacle_cache.get(obstacles) if obstacles else _NO_OBSTACLES
+        
+        # Try turns towards the side that worked last time first
+        sign = self._last_deflect_sign
+        best, x, y = best_candidate(float(current[0]), float(current[1]), float(target[0]), float(target[1]),
+                                    float(self.speed), float(sign), obs.x0, obs.y0, obs.x1, obs.y1,
+                                    float(self.size + 20), float(WINDOW_WIDTH), float(WINDOW_HEIGHT))
+        
+        if best < 0:
+            # Last resort: stay in place
+            return current
+        
+        offset = STEER_OFFSETS[best] * sign
+        if 0 < abs(offset) < 180:
+            self._last_deflect_sign = 1 if offset > 0 else -1
+        return (x, y)
+    
+    def _next_random_pair(self) -> Tuple[float, float]:
+        """Get the next pre-drawn uniform [0, 1) pair, refilling the batch when used up"""
+        if self._random_index == 0:
+            self._random_pairs = self._rng.random((_RANDOM_BATCH, 2)).tolist()
+        pair = self._random_pairs[self._random_index]
+        self._random_index = (self._random_index + 1) % _RANDOM_BATCH
+        return pair
     
     def patrol(self, map_width: float, map_height: float) -> None:
         """
@@ -192,11 +258,12 @@ class BaseAgent(ABC):
             map_width: Map width
             map_height: Map height
         """
-        if self.target_position is None or distance(self.get_position(), self.target_position) < 10:
+        target = self.target_position
+        if target is None or (target[0] - self.x) ** 2 + (target[1] - self.y) ** 2 < 100:
             # Pick new random target
-            import random
-            target_x = random.uniform(30, map_width - 30)
-            target_y = random.uniform(30, map_height - 30)
+            u, v = self._next_random_pair()
+            target_x = 30 + u * (map_width - 60)
+            target_y = 30 + v * (map_height - 60)
             self.set_target(target_x, target_y, MOVEMENT_PATROL)
     
     def send_message(self, recipient: str, message_type: str, content) -> None:
@@ -236,7 +303,9 @@ class BaseAgent(ABC):
         Returns:
             True if within vision range
         """
-        return distance(self.get_position(), (x, y)) <= self.vision_range
+        dx = x - self.x
+        dy = y - self.y
+        return dx * dx + dy * dy <= self.vision_range_sq
     
     def can_communicate(self, agent: 'BaseAgent') -> bool:
         """
@@ -248,7 +317,9 @@ class BaseAgent(ABC):
         Returns:
             True if within communication range
         """
-        return distance(self.get_position(), agent.get_position()) <= self.communication_range
+        dx = agent.x - self.x
+        dy = agent.y - self.y
+        return dx * dx + dy * dy <= self.communication_range_sq
     
     def consume_energy(self, amount: float) -> None:
         """Consume energy"""
@@ -286,40 +357,25 @@ class BaseAgent(ABC):
         """Detect if stuck near wall and try to escape"""
         current = self.get_position()
         
-        # Track movement history
+        # Track movement history (deque drops the oldest entry past 30)
         self.last_positions.append(current)
-        if len(self.last_positions) > 30:  # Increased window for more stable detection
-            self.last_positions.pop(0)
         
         # Check if agent has moved significantly in last frames
-        if len(self.last_positions) >= 30:
-            distance_moved = distance(self.last_positions[0], current)
-            if distance_moved < 8:  # Very little movement
+        if len(self.last_positions) == self.last_positions.maxlen:
+            if distance_sq(self.last_positions[0], current) < 64:  # Very little movement (< 8px)
                 self.stuck_counter += 1
             else:
                 self.stuck_counter = 0
         
-        # Check how close to walls/obstacles
-        min_dist_to_obstacle = float('inf')
-        for obs in obstacles:
-            # Distance from current position to obstacle
-            closest_x = max(obs.x, min(current[0], obs.x + obs.width))
-            closest_y = max(obs.y, min(current[1], obs.y + obs.height))
-            dist = distance(current, (closest_x, closest_y))
-            min_dist_to_obstacle = min(min_dist_to_obstacle, dist)
-        
         # Only trigger escape if truly stuck for a longer period
         if self.stuck_counter > 10:  # Much higher threshold - only after 10 frames of being stuck
-            import random
-            import math
             # Generate random escape direction, away from current position
-            escape_angle = random.uniform(0, 2 * 3.14159)
+            escape_angle = random.uniform(0, TAU)
             escape_distance = 200
             escape_x = current[0] + math.cos(escape_angle) * escape_distance
             escape_y = current[1] + math.sin(escape_angle) * escape_distance
             
             # Clamp to map bounds
-            from src.utils.helpers import clamp_position
             target_pos = clamp_position((escape_x, escape_y), WINDOW_WIDTH, WINDOW_HEIGHT)
             self.set_target(target_pos[0], target_pos[1], MOVEMENT_PATROL)
             self.stuck_counter = 0
@@ -329,30 +385,39 @@ class BaseAgent(ABC):
         """Agent decision-making logic - to be implemented by subclasses"""
         pass
     
-    def draw(self, surface: pygame.Surface) -> None:
+    def _draw_plain(self, surface: pygame.Surface) -> None:
         """Draw the agent"""
         # Draw agent circle
-        color_map = {
-            AGENT_ROLE_EXPLORER: COLOR_BLUE,
-            AGENT_ROLE_COLLECTOR: COLOR_GREEN,
-            AGENT_ROLE_ATTACKER: COLOR_RED,
-            AGENT_ROLE_STRATEGIST: COLOR_MAGENTA,
-        }
-        color = color_map.get(self.role, COLOR_GRAY)
-        
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.size)
-        pygame.draw.circle(surface, COLOR_WHITE, (int(self.x), int(self.y)), self.size, 2)
-        
-        # Draw vision range (debug)
-        if SHOW_AGENT_VISION and DEBUG_MODE:
-            pygame.draw.circle(surface, color, (int(self.x), int(self.y)), 
-                              self.vision_range, 1)
+        color = BaseAgent._ROLE_COLORS.get(self.role, COLOR_GRAY)
+        
+        center = (self.ix, self.iy)
+        pygame.draw.circle(surface, color, center, self.size)
+        pygame.draw.circle(surface, COLOR_WHITE, center, self.size, 2)
         
         # Draw role label
-        font = pygame.font.Font(None, 16)
-        label = font.render(self.role[0].upper(), True, COLOR_WHITE)
+        label = BaseAgent._role_label_cache.get(self.role)
+        if label is None:
+            if BaseAgent._label_font is None:
+                # Render every known role's glyph together with the font
+                BaseAgent._label_font = pygame.font.Font(None, 16)
+                for role in BaseAgent._ROLE_COLORS:
+                    BaseAgent._role_label_cache[role] = BaseAgent._label_font.render(
+                        role[0].upper(), True, COLOR_WHITE)
+            label = BaseAgent._role_label_cache.get(self.role)
+            if label is None:
+                label = BaseAgent._label_font.render(self.role[0].upper(), True, COLOR_WHITE)
+                BaseAgent._role_label_cache[self.role] = label
         surface.blit(label, (self.x - 4, self.y - 4))
     
+    def _draw_with_vision(self, surface: pygame.Surface) -> None:
+        """Draw the agent and its vision range (debug)"""
+        self._draw_plain(surface)
+        color = BaseAgent._ROLE_COLORS.get(self.role, COLOR_GRAY)
+        pygame.draw.circle(surface, color, (self.ix, self.iy), self.vision_range, 1)
+    
+    # The debug flags are fixed at import, so pick the draw variant once
+    draw = _draw_with_vision if SHOW_AGENT_VISION and DEBUG_MODE else _draw_plain
+    
     def reset(self) -> None:
         """Reset agent to initial state"""
         self.vx = 0
@@ -360,6 +425,7 @@ class BaseAgent(ABC):
         self.target_position = None
         self.movement_type = MOVEMENT_PATROL
         self.active = True
-        self.carrying.clear()
+        self.carrying_count = 0
+        self.carrying_value = 0.0
         self.energy = self.max_energy
         self.messages.clear()
@@ -2,9 +2,17 @@
 Collector Agent
 Gathers resources and delivers them to base camp
 """
+import math
+import random
 from config.game_config import *
 from src.agents.base_agent import BaseAgent
-from src.utils.helpers import distance
+from src.communication.blackboard import (BaseBreachedPayload, ResourceCollectedPayload,
+                                          ResourcesDeliveredPayload)
+from src.utils.helpers import TAU
+
+
+# Directions to the waypoints of the patrol circle around base
+_PATROL_DIRECTIONS = [(math.cos(TAU * i / 64), math.sin(TAU * i / 64)) for i in range(64)]
 
 
 class CollectorAgent(BaseAgent):
@@ -23,10 +31,12 @@ class CollectorAgent(BaseAgent):
         """
         super().__init__(agent_id, AGENT_ROLE_COLLECTOR, x, y)
         self.base_camp = base_camp
+        self._base_pos = tuple(base_camp.get_position())  # Base camp never moves
         self.resource_manager = resource_manager
         self.carrying_capacity = 5
         self.current_target_resource = None
         self.returning_to_base = False
+        self._patrol_index = random.randrange(64)  # Next waypoint on the patrol circle
     
     def think(self) -> None:
         """Collector decision-making logic"""
@@ -35,7 +45,7 @@ class CollectorAgent(BaseAgent):
         
         # Check if at base
         if self.base_camp.is_agent_inside(self.x, self.y, self.size):
-            if len(self.carrying) > 0:
+            if self.carrying_count > 0:
                 # Deliver resources immediately
                 self._deliver_resources()
                 self.returning_to_base = False
@@ -67,8 +77,16 @@ class CollectorAgent(BaseAgent):
         
         if resource_locations:
             # Find nearest resource
-            nearest = min(resource_locations,
-                         key=lambda r: distance(self.get_position(), r))
+            px, py = self.x, self.y
+            nearest = None
+            best_d2 = float('inf')
+            for location in resource_locations:
+                dx = location[0] - px
+                dy = location[1] - py
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    nearest = location
             self.current_target_resource = nearest
             self.set_target(nearest[0], nearest[1], MOVEMENT_COLLECT)
     
@@ -79,31 +97,12 @@ class CollectorAgent(BaseAgent):
         Returns:
             Tuple of (x, y) for nearest visible resource, or None
         """
-        if not self.resource_manager:
-            return None
-        
-        # Get all active resources
-        resources = self.resource_manager.resources
-        
-        if not resources:
+        if not self.resource_manager or self.carrying_count >= self.carrying_capacity:
             return None
         
-        # Find resources within vision range
-        visible_resources = []
-        for resource in resources:
-            res_pos = resource.get_position()
-            dist = distance(self.get_position(), res_pos)
-            
-            # Check if within collector's vision range
-            if dist <= self.vision_range and len(self.carrying) < self.carrying_capacity:
-                visible_resources.append((res_pos, dist))
-        
-        # Return nearest visible resource
-        if visible_resources:
-            nearest = min(visible_resources, key=lambda x: x[1])
-            return nearest[0]
-        
-        return None
+        # Nearest active resource within vision range
+        nearest = self.resource_manager.index.query_nearest(self.x, self.y, self.vision_range)
+        return nearest.get_position() if nearest else None
     
     def _move_to_resource(self) -> None:
         """Move to target resource"""
@@ -111,21 +110,21 @@ class CollectorAgent(BaseAgent):
             return
         
         # Check if reached resource (increased tolerance to 30px for easier collection)
-        dist_to_resource = distance(self.get_position(), self.current_target_resource)
-        if dist_to_resource < 30:
+        rx, ry = self.current_target_resource
+        if (rx - self.x) ** 2 + (ry - self.y) ** 2 < 900:
             self._collect_resource()
             # After collecting, clear target
             if not self.current_target_resource or self.current_target_resource is None:
                 # Resource was collected, check if at capacity
-                if len(self.carrying) >= self.carrying_capacity:
+                if self.carrying_count >= self.carrying_capacity:
                     self.returning_to_base = True
-        else:
-            # Still moving to resource, update target to ensure we keep moving
-            self.set_target(self.current_target_resource[0], self.current_target_resource[1], MOVEMENT_COLLECT)
+        elif self.target_position != self.current_target_resource or self.movement_type != MOVEMENT_COLLECT:
+            # Target was cleared or replaced (e.g. by an escape move); head for the resource again
+            self.set_target(rx, ry, MOVEMENT_COLLECT)
     
     def _collect_resource(self) -> None:
         """Collect a resource"""
-        if not self.current_target_resource or len(self.carrying) >= self.carrying_capacity:
+        if not self.current_target_resource or self.carrying_count >= self.carrying_capacity:
             return
         
         if self.resource_manager:
@@ -139,15 +138,10 @@ class CollectorAgent(BaseAgent):
             if resource:
                 # Collect from resource manager (removes it)
                 if self.resource_manager.collect_resource(resource):
-                    self.carrying.append({
-                        "position": self.current_target_resource,
-                        "value": RESOURCE_VALUE
-                    })
-                    self.broadcast_message("resource_collected", {
-                        "collector_id": self.id,
-                        "total_carrying": len(self.carrying),
-                        "position": self.current_target_resource
-                    })
+                    self.carrying_count += 1
+                    self.carrying_value += RESOURCE_VALUE
+                    self.broadcast_message("resource_collected", ResourceCollectedPayload(
+                        self.id, self.carrying_count, self.current_target_resource))
                     # Clear target after successful collection
                     self.current_target_resource = None
             else:
@@ -156,20 +150,18 @@ class CollectorAgent(BaseAgent):
     
     def _return_to_base(self) -> None:
         """Return to base camp"""
-        base_pos = self.base_camp.get_position()
+        base_pos = self._base_pos
         self.set_target(base_pos[0], base_pos[1], MOVEMENT_RETURN_HOME)
     
     def _deliver_resources(self) -> None:
         """Deliver resources to base"""
-        delivered_count = len(self.carrying)
+        delivered_count = self.carrying_count
         self.base_camp.add_resources(delivered_count)
-        self.carrying.clear()
+        self.carrying_count = 0
+        self.carrying_value = 0.0
         
-        self.broadcast_message("resources_delivered", {
-            "collector_id": self.id,
-            "count": delivered_count,
-            "total_at_base": self.base_camp.get_resources()
-        })
+        self.broadcast_message("resources_delivered", ResourcesDeliveredPayload(
+            self.id, delivered_count, self.base_camp.get_resources()))
     
     def _process_messages(self) -> None:
         """Process incoming messages from explorer"""
@@ -180,24 +172,23 @@ class CollectorAgent(BaseAgent):
                 self.returning_to_base = True
             elif message.message_type == "resource_found":
                 # Explorer found a resource - go collect it
-                content = message.content
-                if "position" in content:
-                    self.current_target_resource = tuple(content["position"])
+                position = message.content.position
+                if position:
+                    self.current_target_resource = tuple(position)
                     # Set target to move to resource
                     self.set_target(self.current_target_resource[0], self.current_target_resource[1], MOVEMENT_COLLECT)
     
     def _patrol_base(self) -> None:
         """Patrol near base camp while waiting for orders"""
-        import random
-        import math
-        
         # Patrol in a circle around base
-        base_pos = self.base_camp.get_position()
-        angle = random.uniform(0, 2 * math.pi)
+        base_pos = self._base_pos
+        i = self._patrol_index
+        cos_a, sin_a = _PATROL_DIRECTIONS[i]
+        self._patrol_index = (i + 1) & 63
         patrol_radius = 80
         
-        patrol_x = base_pos[0] + patrol_radius * math.cos(angle)
-        patrol_y = base_pos[1] + patrol_radius * math.sin(angle)
+        patrol_x = base_pos[0] + patrol_radius * cos_a
+        patrol_y = base_pos[1] + patrol_radius * sin_a
         
         self.set_target(patrol_x, patrol_y, MOVEMENT_PATROL)
     
@@ -211,7 +202,4 @@ class CollectorAgent(BaseAgent):
         """
         if base_resources_after < base_resources_before:
             stolen_count = base_resources_before - base_resources_after
-            self.broadcast_message("base_breached", {
-                "collector_id": self.id,
-                "resources_stolen": stolen_count
-            })
+            self.broadcast_message("base_breached", BaseBreachedPayload(self.id, stolen_count))
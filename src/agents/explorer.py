@@ -5,7 +5,12 @@ Scouts the map to discover resources and detect the thief
 import random
 from config.game_config import *
 from src.agents.base_agent import BaseAgent
-from src.utils.helpers import distance, random_position
+from src.communication.blackboard import (ExplorationUpdatePayload, ResourceDiscoveredPayload,
+                                          ThiefSightedPayload)
+
+
+# Center point of each map zone
+_ZONE_CENTERS = {name: ((b[0] + b[2]) / 2, (b[1] + b[3]) / 2) for name, b in ZONES.items()}
 
 
 class ExplorerAgent(BaseAgent):
@@ -22,9 +27,11 @@ class ExplorerAgent(BaseAgent):
         """
         super().__init__(agent_id, AGENT_ROLE_EXPLORER, x, y)
         self.explored_zones = set()
+        self._unexplored = random.sample(list(ZONES), len(ZONES))  # Visit order, popped from the end
         self.current_zone = None
         self.thief_last_seen = None
         self.detection_cooldown = 0
+        self._report_tick = random.randint(0, 19)  # Staggers reports across explorers
     
     def think(self) -> None:
         """Explorer decision-making logic"""
@@ -51,21 +58,17 @@ class ExplorerAgent(BaseAgent):
     
     def _select_zone_to_explore(self) -> None:
         """Select a zone to explore"""
-        zones = ZONES
-        # Pick unexplored zone
-        unexplored = [z for z in zones if z not in self.explored_zones]
-        
-        if unexplored:
-            self.current_zone = random.choice(unexplored)
-            zone_bounds = ZONES[self.current_zone]
-            target_x = (zone_bounds[0] + zone_bounds[2]) / 2
-            target_y = (zone_bounds[1] + zone_bounds[3]) / 2
+        # Pick unexplored zone (the visit order was shuffled up front)
+        if self._unexplored:
+            self.current_zone = self._unexplored.pop()
+            target_x, target_y = _ZONE_CENTERS[self.current_zone]
             self.set_target(target_x, target_y, MOVEMENT_PATROL)
             self.explored_zones.add(self.current_zone)
         else:
             # All zones explored, pick random area
-            target_x = random.uniform(50, WINDOW_WIDTH - 50)
-            target_y = random.uniform(50, WINDOW_HEIGHT - 50)
+            u, v = self._next_random_pair()
+            target_x = 50 + u * (WINDOW_WIDTH - 100)
+            target_y = 50 + v * (WINDOW_HEIGHT - 100)
             self.set_target(target_x, target_y, MOVEMENT_PATROL)
             self.current_zone = None
     
@@ -83,12 +86,12 @@ class ExplorerAgent(BaseAgent):
     
     def _report_status(self) -> None:
         """Report exploration status to strategist"""
-        if random.random() < 0.05:  # Report occasionally
-            self.send_message(f"agent_strategist", "exploration_update", {
-                "explorer_id": self.id,
-                "position": self.get_position(),
-                "explored_zones": len(self.explored_zones)
-            })
+        # Report occasionally (every 20th frame)
+        self._report_tick += 1
+        if self._report_tick >= 20:
+            self._report_tick = 0
+            self.send_message(f"agent_strategist", "exploration_update", ExplorationUpdatePayload(
+                self.id, self.get_position(), len(self.explored_zones)))
     
     def _process_messages(self) -> None:
         """Process incoming messages"""
@@ -96,25 +99,19 @@ class ExplorerAgent(BaseAgent):
         for message in messages:
             if message.message_type == "scan_zone":
                 # Strategist ordered to scan specific zone
-                content = message.content
-                if "zone" in content:
-                    self.set_target(content["zone"][0], content["zone"][1])
+                zone = message.content.zone
+                self.set_target(zone[0], zone[1])
     
     def report_resource(self, x: float, y: float) -> None:
         """Report a discovered resource to strategist"""
         self.blackboard.add_resource_location((x, y), self.id)
         
         # Report to strategist first
-        self.send_message("agent_strategist", "resource_discovered", {
-            "position": (x, y),
-            "explorer_id": self.id
-        })
+        discovery = ResourceDiscoveredPayload((x, y), self.id)
+        self.send_message("agent_strategist", "resource_discovered", discovery)
         
         # Broadcast for all to know
-        self.broadcast_message("resource_discovered", {
-            "position": (x, y),
-            "explorer_id": self.id
-        })
+        self.broadcast_message("resource_discovered", discovery)
     
     def report_thief_sighting(self, x: float, y: float) -> None:
         """Report sighting of thief to strategist and attackers"""
@@ -125,44 +122,19 @@ class ExplorerAgent(BaseAgent):
         self.thief_last_seen = (x, y)
         self.blackboard.update_thief_position((x, y), self.id)
         
+        # One immutable payload is shared by all direct messages
+        sighting = ThiefSightedPayload((x, y), self.id, self.blackboard.read_data("elapsed_time"))
+        
         # Send message to strategist
-        self.send_message("agent_strategist", "thief_sighted", {
-            "position": (x, y),
-            "observer": self.id,
-            "timestamp": self.blackboard.read_data("elapsed_time")
-        })
+        self.send_message("agent_strategist", "thief_sighted", sighting)
         
-        # Send direct alert to all attackers
+        # Send direct alert to all attackers (up to 4 on hard difficulty)
         # Attackers need immediate notification with exact coordinates
-        self.send_message("agent_attacker_0", "thief_sighted", {
-            "position": (x, y),
-            "observer": self.id,
-            "timestamp": self.blackboard.read_data("elapsed_time")
-        })
-        
-        # For hard difficulty with multiple attackers, send to all
-        from config.game_config import DIFFICULTY_HARD
-        self.send_message("agent_attacker_1", "thief_sighted", {
-            "position": (x, y),
-            "observer": self.id,
-            "timestamp": self.blackboard.read_data("elapsed_time")
-        })
-        self.send_message("agent_attacker_2", "thief_sighted", {
-            "position": (x, y),
-            "observer": self.id,
-            "timestamp": self.blackboard.read_data("elapsed_time")
-        })
-        self.send_message("agent_attacker_3", "thief_sighted", {
-            "position": (x, y),
-            "observer": self.id,
-            "timestamp": self.blackboard.read_data("elapsed_time")
-        })
+        for i in range(4):
+            self.send_message(f"agent_attacker_{i}", "thief_sighted", sighting)
         
         # Also broadcast alert for team awareness
-        self.broadcast_message("thief_sighted", {
-            "position": (x, y),
-            "observer": self.id
-        })
+        self.broadcast_message("thief_sighted", ThiefSightedPayload((x, y), self.id))
         
         # Set cooldown to prevent spam (60 frames = 1 second at 60 FPS)
         self.detection_cooldown = 60
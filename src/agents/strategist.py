@@ -2,9 +2,11 @@
 Strategist Agent
 Coordinates all agents and makes strategic decisions
 """
+from typing import List, Tuple
 from config.game_config import *
 from src.agents.base_agent import BaseAgent
-from src.utils.helpers import distance
+from src.communication.blackboard import (CollectResourcePayload, DefendBasePayload, InterceptPayload,
+                                          Message, ResourceFoundPayload)
 
 
 class StrategistAgent(BaseAgent):
@@ -20,11 +22,21 @@ class StrategistAgent(BaseAgent):
             y: Starting Y coordinate (should be base camp)
         """
         super().__init__(agent_id, AGENT_ROLE_STRATEGIST, x, y)
-        self.known_agents = {}
+        self.known_agents: List[Tuple[str, str]] = []  # (agent_id, role), append-only
         self.decision_counter = 0
         self.last_command_time = {}
         self.base_x = x  # Keep reference to base position
         self.base_y = y  # Keep reference to base position
+        self.thief_position = None
+        self._last_thief_version = -1
+        self._last_data_version = -1
+        
+        # Strategist's view of the game, refreshed in place each think
+        self.current_state = {
+            "thief_position": None,
+            "resources_at_base": 0,
+            "base_status": "safe",
+        }
     
     def move(self, obstacles=None) -> None:
         """
@@ -50,62 +62,66 @@ class StrategistAgent(BaseAgent):
     
     def _update_game_state(self) -> None:
         """Update understanding of game state"""
-        thief_pos = self.blackboard.read_data("thief_position")
-        resources_at_base = self.blackboard.read_data("resources_at_base")
-        base_status = self.blackboard.read_data("base_status")
+        # Nothing on the blackboard changed since the last read
+        data_version = self.blackboard.get_data_version()
+        if data_version == self._last_data_version:
+            return
+        self._last_data_version = data_version
+        
+        # Only re-read the thief position when it has been written since last tick
+        thief_version = self.blackboard.get_thief_version()
+        if thief_version != self._last_thief_version:
+            self.thief_position = self.blackboard.read_data("thief_position")
+            self._last_thief_version = thief_version
         
         # Update strategist's knowledge
-        self.current_state = {
-            "thief_position": thief_pos,
-            "resources_at_base": resources_at_base,
-            "base_status": base_status
-        }
+        state = self.current_state
+        state["thief_position"] = self.thief_position
+        state["resources_at_base"] = self.blackboard.read_data("resources_at_base")
+        state["base_status"] = self.blackboard.read_data("base_status")
     
     def _make_strategic_decisions(self) -> None:
         """Make strategic decisions and issue commands"""
         thief_pos = self.current_state.get("thief_position")
         resources = self.current_state.get("resources_at_base", 0)
+        commands = []
         
         # Rule 1: If thief detected, intercept
         if thief_pos:
-            self._command_intercept(thief_pos)
+            commands += self._command_intercept(thief_pos)
         
         # Rule 2: If resources low, increase collection
         if resources < 5:
-            self._command_gather_resources()
+            commands += self._command_gather_resources()
         
         # Rule 3: If base breached, alert attacker
         if self.current_state.get("base_status") == "breached":
-            self._command_defend_base()
+            commands += self._command_defend_base()
+        
+        # Send all of this tick's commands together
+        self.blackboard.send_batch(commands)
     
-    def _command_intercept(self, thief_position: tuple) -> None:
-        """Command attacker to intercept thief"""
-        # Send direct command to attacker
-        self.send_message(
-            "agent_attacker_0",
-            "intercept_command",
-            {"target_position": thief_position}
-        )
+    def _command_intercept(self, thief_position: tuple) -> List[Message]:
+        """Build the command for the attacker to intercept the thief"""
+        # Direct command to attacker
+        return [Message(self.id, "agent_attacker_0", "intercept_command",
+                        InterceptPayload(thief_position))]
     
-    def _command_gather_resources(self) -> None:
-        """Command collectors to gather resources"""
+    def _command_gather_resources(self) -> List[Message]:
+        """Build commands for collectors to gather resources"""
         resource_locations = self.blackboard.read_data("resources_locations")
         
-        if resource_locations:
-            for idx, location in enumerate(resource_locations[:2]):  # Command first 2
-                self.send_message(
-                    f"agent_collector_{idx}",
-                    "collect_resource",
-                    {"position": location}
-                )
+        if not resource_locations:
+            return []
+        return [
+            Message(self.id, f"agent_collector_{idx}", "collect_resource", CollectResourcePayload(location))
+            for idx, location in enumerate(list(resource_locations)[:2])  # Command first 2
+        ]
     
-    def _command_defend_base(self) -> None:
-        """Command agents to defend base"""
-        self.send_message(
-            f"agent_attacker_0",
-            "defend_base",
-            {"base_position": (BASE_CAMP_X, BASE_CAMP_Y)}
-        )
+    def _command_defend_base(self) -> List[Message]:
+        """Build the command for agents to defend the base"""
+        return [Message(self.id, "agent_attacker_0", "defend_base",
+                        DefendBasePayload((BASE_CAMP_X, BASE_CAMP_Y)))]
     
     def _process_alerts(self) -> None:
         """Process alerts from blackboard"""
@@ -127,25 +143,21 @@ class StrategistAgent(BaseAgent):
             if message.message_type == "thief_sighted":
                 # Explorer reported thief - update threat level
                 content = message.content
-                self.blackboard.post_data("thief_position", content.get("position"))
+                self.blackboard.post_data("thief_position", content.position)
                 self.current_threat_level = "high"
                 # Command attacker immediately
-                self._command_intercept(content.get("position"))
+                self.blackboard.send_batch(self._command_intercept(content.position))
                 
             elif message.message_type == "resource_discovered":
                 # Explorer found a resource - forward to collectors
-                content = message.content
-                resource_pos = content.get("position")
+                resource_pos = message.content.position
                 if resource_pos:
                     # Send to all collectors
                     self._forward_resource_to_collectors(resource_pos)
                     
             elif message.message_type == "resources_delivered":
                 # Update resource count
-                content = message.content
-                if "total_at_base" in content:
-                    self.blackboard.post_data("resources_at_base", 
-                                             content["total_at_base"])
+                self.blackboard.post_data("resources_at_base", message.content.total_at_base)
             elif message.message_type == "base_breached":
                 # Alert! Thief in base
                 self.blackboard.post_data("base_status", "breached")
@@ -157,7 +169,7 @@ class StrategistAgent(BaseAgent):
             self.send_message(
                 f"agent_collector_{i}",
                 "collect_resource",
-                {"position": resource_position}
+                CollectResourcePayload(resource_position)
             )
     
     def _forward_resource_to_collectors(self, resource_position: tuple) -> None:
@@ -166,17 +178,17 @@ class StrategistAgent(BaseAgent):
             self.send_message(
                 f"agent_collector_{i}",
                 "resource_found",
-                {"position": resource_position}
+                ResourceFoundPayload(resource_position)
             )
     
     def register_agent(self, agent_id: str, agent_role: str) -> None:
         """Register an agent under strategist's command"""
-        self.known_agents[agent_id] = agent_role
+        self.known_agents.append((agent_id, agent_role))
     
     def get_team_status(self) -> dict:
         """Get status of entire team"""
         return {
-            "agents": self.known_agents,
+            "agents": dict(self.known_agents),  # later registrations win
             "threat_level": getattr(self, 'current_threat_level', 'low'),
             "game_state": self.current_state
         }
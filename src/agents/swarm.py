@@ -0,0 +1,51 @@
+"""
+Agent Swarm
+Structure-of-arrays snapshot of agent state for batched spatial queries
+"""
+from typing import List
+import numpy as np
+from src.utils.helpers import in_range_batch
+
+
+class AgentSwarm:
+    """Holds agent state as NumPy columns, one row per agent"""
+
+    def __init__(self):
+        """Initialize an empty swarm"""
+        self.agents: List = []
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.vision_sq = np.zeros(0)
+
+    def bind(self, agents: List) -> None:
+        """
+        Allocate columns for a new set of agents
+
+        Args:
+            agents: Agents in row order
+        """
+        self.agents = list(agents)
+        count = len(self.agents)
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.vision_sq = np.array([agent.vision_range_sq for agent in self.agents], dtype=np.float64)
+        self.sync()
+
+    def sync(self) -> None:
+        """Copy current agent positions into the columns"""
+        agents = self.agents
+        self.x[:] = [agent.x for agent in agents]
+        self.y[:] = [agent.y for agent in agents]
+
+    def visible_from(self, x: float, y: float) -> np.ndarray:
+        """
+        Check which agents can see a position
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Boolean array, True where the position is within the agent's vision range
+        """
+        return in_range_batch(x, y, self.x, self.y, self.vision_sq)
@@ -2,14 +2,18 @@
 Blackboard Communication System
 Shared memory for multi-agent communication and coordination
 """
+from collections import deque, namedtuple
+from itertools import count
 from typing import Any, Dict, List, Optional
-from datetime import datetime
 import threading
+import time
 
 
 class Message:
     """Represents a message in the communication system"""
     
+    __slots__ = ('sender', 'recipient', 'message_type', 'content', 'priority', 'timestamp')
+    
     def __init__(self, sender: str, recipient: str, message_type: str, content: Any, priority: int = 1):
         """
         Initialize a message
@@ -26,22 +30,53 @@ class Message:
         self.message_type = message_type
         self.content = content
         self.priority = priority
-        self.timestamp = datetime.now()
-        self.read = False
+        self.timestamp = time.monotonic()  # seconds on the monotonic clock
     
     def __repr__(self):
         return f"Message({self.sender} -> {self.recipient}: {self.message_type})"
 
 
+# Number of most recent messages kept in message_history
+MESSAGE_HISTORY_LIMIT = 1000
+
+
+# Message contents, one lightweight payload type per message type
+ThiefSightedPayload = namedtuple("ThiefSightedPayload", "position observer timestamp", defaults=(None,))
+ThiefCaughtPayload = namedtuple("ThiefCaughtPayload", "attacker_id tx ty")
+InterceptPayload = namedtuple("InterceptPayload", "target_position")
+AttackerThiefSpottedPayload = namedtuple("AttackerThiefSpottedPayload", "attacker_id position")
+ExplorationUpdatePayload = namedtuple("ExplorationUpdatePayload", "explorer_id position explored_zones")
+ScanZonePayload = namedtuple("ScanZonePayload", "zone")
+ResourceDiscoveredPayload = namedtuple("ResourceDiscoveredPayload", "position explorer_id")
+ResourceFoundPayload = namedtuple("ResourceFoundPayload", "position")
+CollectResourcePayload = namedtuple("CollectResourcePayload", "position")
+ResourceCollectedPayload = namedtuple("ResourceCollectedPayload", "collector_id total_carrying position")
+ResourcesDeliveredPayload = namedtuple("ResourcesDeliveredPayload", "collector_id count total_at_base")
+BaseBreachedPayload = namedtuple("BaseBreachedPayload", "collector_id resources_stolen")
+DefendBasePayload = namedtuple("DefendBasePayload", "base_position")
+
+
 class Blackboard:
     """
     Central communication and knowledge sharing system for all agents
     Uses a shared memory approach with message passing
+
+    Single-key reads and writes of `data` (read_data/post_data) go without a
+    lock: a dict get or item assignment with a str key is atomic under the GIL.
+    Anything that reads then writes (version counter, location set) still
+    takes _data_lock.
+
+    "resources_locations" is an insertion-ordered dict used as a set (values
+    are None); take list(...) of it before iterating outside _data_lock.
     """
     
     def __init__(self):
         """Initialize the blackboard"""
-        self.lock = threading.Lock()
+        # Separate locks so data, message and alert traffic don't contend with
+        # each other; when two are needed, take them in this order
+        self._data_lock = threading.Lock()
+        self._msg_lock = threading.Lock()
+        self._alert_lock = threading.Lock()
         
         # Shared knowledge
         self.data = {
@@ -49,7 +84,7 @@ class Blackboard:
             "thief_last_seen": None,
             "resources_at_base": 0,
             "resources_collected_total": 0,
-            "resources_locations": [],
+            "resources_locations": {},
             "base_status": "safe",
             "agents_status": {},
             "strategist_commands": [],
@@ -58,13 +93,22 @@ class Blackboard:
             "elapsed_time": 0,
         }
         
-        # Message queue
-        self.messages: List[Message] = []
-        self.message_history: List[Message] = []
+        # Per-agent inboxes; messages are routed here when sent
+        self._inboxes: Dict[str, deque] = {}
+        self.message_history: deque = deque(maxlen=MESSAGE_HISTORY_LIMIT)
+        self.messages_sent = 0  # messages delivered (to an inbox or broadcast) since the last reset
         
         # Alerts and notifications
         self.alerts = []
         
+        # Bumped on every write to "thief_position" so readers can skip re-reads
+        self._thief_version = 0
+        
+        # Changes on every write that alters shared data; taken from a counter
+        # (next() is atomic) so racing lock-free writers never reuse a value
+        self._data_versions = count(1)
+        self._data_version = 0
+        
     def post_data(self, key: str, value: Any) -> None:
         """
         Post data to the blackboard
@@ -73,8 +117,17 @@ class Blackboard:
             key: Data key
             value: Data value
         """
-        with self.lock:
+        if key == "thief_position":
+            with self._data_lock:
+                self.data[key] = value
+                self._thief_version += 1
+                self._data_version = next(self._data_versions)
+        else:
+            old = self.data.get(key)
             self.data[key] = value
+            # Re-posting an equal value is not a change
+            if value is not old and value != old:
+                self._data_version = next(self._data_versions)
     
     def read_data(self, key: str) -> Optional[Any]:
         """
@@ -86,8 +139,7 @@ class Blackboard:
         Returns:
             Data value or None if not found
         """
-        with self.lock:
-            return self.data.get(key)
+        return self.data.get(key)
     
     def update_data(self, updates: Dict[str, Any]) -> None:
         """
@@ -96,8 +148,11 @@ class Blackboard:
         Args:
             updates: Dictionary of key-value pairs to update
         """
-        with self.lock:
+        with self._data_lock:
             self.data.update(updates)
+            if "thief_position" in updates:
+                self._thief_version += 1
+            self._data_version = next(self._data_versions)
     
     def get_all_data(self) -> Dict[str, Any]:
         """
@@ -106,7 +161,7 @@ class Blackboard:
         Returns:
             Copy of all data
         """
-        with self.lock:
+        with self._data_lock:
             return self.data.copy()
     
     def send_message(self, message: Message) -> None:
@@ -116,9 +171,49 @@ class Blackboard:
         Args:
             message: Message object to send
         """
-        with self.lock:
-            self.messages.append(message)
-            self.message_history.append(message)
+        with self._msg_lock:
+            self._deliver(message)
+    
+    def send_batch(self, messages: List[Message]) -> None:
+        """
+        Send several messages while holding the message lock once
+        
+        Args:
+            messages: Message objects to send, in order
+        """
+        if not messages:
+            return
+        with self._msg_lock:
+            for message in messages:
+                self._deliver(message)
+    
+    def _deliver(self, message: Message) -> None:
+        """
+        Route a message to its inboxes (caller holds _msg_lock)
+        
+        Direct messages to an agent without an inbox are dropped; they never
+        reach message_history or messages_sent.
+        """
+        if message.recipient == 'all':
+            for inbox in self._inboxes.values():
+                inbox.append(message)
+        else:
+            inbox = self._inboxes.get(message.recipient)
+            if inbox is None:
+                return  # No such agent (e.g. attacker_3 on easy)
+            inbox.append(message)
+        self.message_history.append(message)
+        self.messages_sent += 1
+    
+    def register_inbox(self, agent_id: str) -> None:
+        """
+        Create an inbox so an agent receives messages sent from now on
+        
+        Args:
+            agent_id: Agent ID to register
+        """
+        with self._msg_lock:
+            self._inboxes.setdefault(agent_id, deque())
     
     def get_messages(self, recipient: str, unread_only: bool = True) -> List[Message]:
         """
@@ -126,24 +221,20 @@ class Blackboard:
         
         Args:
             recipient: Agent ID to retrieve messages for
-            unread_only: If True, only return unread messages
+            unread_only: If True, drain the recipient's inbox; otherwise
+                return every message ever addressed to it
             
         Returns:
             List of messages
         """
-        with self.lock:
-            if unread_only:
-                messages = [m for m in self.messages 
-                           if (m.recipient == recipient or m.recipient == 'all') 
-                           and not m.read]
-            else:
-                messages = [m for m in self.messages 
-                           if m.recipient == recipient or m.recipient == 'all']
-            
-            # Mark messages as read
-            for msg in messages:
-                msg.read = True
+        with self._msg_lock:
+            if not unread_only:
+                return [m for m in self.message_history
+                        if m.recipient == recipient or m.recipient == 'all']
             
+            inbox = self._inboxes.setdefault(recipient, deque())
+            messages = list(inbox)
+            inbox.clear()
             return messages
     
     def broadcast_message(self, sender: str, message_type: str, content: Any, priority: int = 1) -> None:
@@ -168,12 +259,12 @@ class Blackboard:
             content: Alert content
             severity: Severity level ('info', 'warning', 'critical')
         """
-        with self.lock:
+        with self._alert_lock:
             alert = {
                 'type': alert_type,
                 'content': content,
                 'severity': severity,
-                'timestamp': datetime.now(),
+                'timestamp': time.monotonic(),
             }
             self.alerts.append(alert)
     
@@ -187,7 +278,7 @@ class Blackboard:
         Returns:
             List of alerts
         """
-        with self.lock:
+        with self._alert_lock:
             alerts_copy = self.alerts.copy()
             if clear:
                 self.alerts.clear()
@@ -201,21 +292,42 @@ class Blackboard:
             position: Thief coordinates (x, y)
             observer_id: ID of agent that spotted the thief
         """
-        with self.lock:
+        now = time.monotonic()
+        with self._data_lock, self._alert_lock:
             self.data["thief_position"] = position
+            self._thief_version += 1
             self.data["thief_last_seen"] = {
                 "position": position,
                 "observer": observer_id,
-                "timestamp": datetime.now()
+                "timestamp": now
             }
             # Post alert directly without calling post_alert to avoid lock recursion
             alert = {
                 'type': 'thief_sighting',
                 'content': {"position": position, "observer": observer_id},
                 'severity': 'warning',
-                'timestamp': datetime.now(),
+                'timestamp': now,
             }
             self.alerts.append(alert)
+            self._data_version = next(self._data_versions)
+    
+    def get_thief_version(self) -> int:
+        """
+        Get the thief position version counter
+        
+        Returns:
+            Number that changes whenever the thief position is written
+        """
+        return self._thief_version
+    
+    def get_data_version(self) -> int:
+        """
+        Get the shared data version counter
+        
+        Returns:
+            Number that changes whenever shared data is changed
+        """
+        return self._data_version
     
     def add_resource_location(self, position: tuple, discovery_id: str) -> None:
         """
@@ -225,11 +337,12 @@ class Blackboard:
             position: Resource coordinates (x, y)
             discovery_id: ID of agent that discovered it
         """
-        with self.lock:
-            locations = self.data.get("resources_locations", [])
-            if position not in locations:
-                locations.append(position)
-                self.data["resources_locations"] = locations
+        with self._data_lock:
+            locations = self.data.get("resources_locations")
+            if locations is None:
+                locations = self.data["resources_locations"] = {}
+            locations[position] = None
+            self._data_version = next(self._data_versions)
     
     def remove_resource_location(self, position: tuple) -> None:
         """
@@ -238,11 +351,11 @@ class Blackboard:
         Args:
             position: Resource coordinates to remove
         """
-        with self.lock:
-            locations = self.data.get("resources_locations", [])
-            if position in locations:
-                locations.remove(position)
-                self.data["resources_locations"] = locations
+        with self._data_lock:
+            locations = self.data.get("resources_locations")
+            if locations is not None:
+                locations.pop(position, None)
+            self._data_version = next(self._data_versions)
     
     def get_message_history(self, limit: int = 50) -> List[Message]:
         """
@@ -254,32 +367,33 @@ class Blackboard:
         Returns:
             List of recent messages
         """
-        with self.lock:
-            return self.message_history[-limit:]
+        with self._msg_lock:
+            history = self.message_history
+            return [history[i] for i in range(max(0, len(history) - limit), len(history))]
     
     def clear_old_messages(self, max_age_seconds: int = 300) -> None:
         """
-        Clear old messages from the message queue
+        Clear old undelivered messages from the inboxes
         
         Args:
             max_age_seconds: Remove messages older than this
         """
-        with self.lock:
-            current_time = datetime.now()
-            self.messages = [
-                m for m in self.messages 
-                if (current_time - m.timestamp).total_seconds() < max_age_seconds
-            ]
+        with self._msg_lock:
+            cutoff = time.monotonic() - max_age_seconds
+            for inbox in self._inboxes.values():
+                # Inboxes are in send order, so old messages sit at the front
+                while inbox and inbox[0].timestamp <= cutoff:
+                    inbox.popleft()
     
     def reset(self) -> None:
         """Reset the blackboard to initial state"""
-        with self.lock:
+        with self._data_lock:
             self.data = {
                 "thief_position": None,
                 "thief_last_seen": None,
                 "resources_at_base": 0,
                 "resources_collected_total": 0,
-                "resources_locations": [],
+                "resources_locations": {},
                 "base_status": "safe",
                 "agents_status": {},
                 "strategist_commands": [],
@@ -287,17 +401,20 @@ class Blackboard:
                 "game_state": "running",
                 "elapsed_time": 0,
             }
-            self.messages.clear()
+            self._thief_version += 1
+            self._data_version = next(self._data_versions)
+        with self._msg_lock:
+            self._inboxes.clear()
+            self.message_history.clear()
+            self.messages_sent = 0
+        with self._alert_lock:
             self.alerts.clear()
 
 
-# Global blackboard instance
-_blackboard_instance = None
+# Global blackboard instance, created at import
+_blackboard_instance = Blackboard()
 
 
 def get_blackboard() -> Blackboard:
-    """Get or create the global blackboard instance"""
-    global _blackboard_instance
-    if _blackboard_instance is None:
-        _blackboard_instance = Blackboard()
+    """Get the global blackboard instance"""
     return _blackboard_instance
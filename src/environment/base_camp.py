@@ -4,12 +4,16 @@ Manages the team's base camp where resources are stored
 """
 import pygame
 from config.game_config import *
-from src.utils.helpers import distance, circle_overlap
+from src.utils.helpers import circle_overlap
 
 
 class BaseCamp:
     """Represents the base camp"""
     
+    # Label font and static "BASE" text, created on first draw
+    _font = None
+    _label = None
+    
     def __init__(self, x: float = BASE_CAMP_X, y: float = BASE_CAMP_Y):
         """
         Initialize the base camp
@@ -25,6 +29,11 @@ class BaseCamp:
         self.resources_stolen = 0
         self.last_breach_time = None
         self.breach_count = 0
+        self.version = 0  # bumped whenever resources_stored changes (never reset)
+        
+        # Rendered resource count, re-rendered only when the count changes
+        self._count_value = None
+        self._count_surface = None
     
     def get_position(self) -> tuple:
         """Get base camp position"""
@@ -68,6 +77,7 @@ class BaseCamp:
             count: Number of resources to add
         """
         self.resources_stored += count
+        self.version += 1
     
     def remove_resources(self, count: int) -> bool:
         """
@@ -81,6 +91,7 @@ class BaseCamp:
         """
         if self.resources_stored >= count:
             self.resources_stored -= count
+            self.version += 1
             self.resources_stolen += count
             self.breach_count += 1
             return True
@@ -106,6 +117,11 @@ class BaseCamp:
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the base camp"""
+        self.draw_static(surface)
+        self.draw_count(surface)
+    
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Draw the parts of the base camp that never change"""
         # Draw catching range (detection zone for attacker)
         # This shows the range within which the attacker can catch the thief
         from config.game_config import CATCHING_DISTANCE, AGENT_SIZE
@@ -117,19 +133,28 @@ class BaseCamp:
         pygame.draw.circle(surface, COLOR_GREEN, (int(self.x), int(self.y)), self.size, 3)
         
         # Draw base label and resource count
-        font = pygame.font.Font(None, 24)
+        if BaseCamp._font is None:
+            BaseCamp._font = pygame.font.Font(None, 24)
+            BaseCamp._label = BaseCamp._font.render("BASE", True, COLOR_WHITE)
         
         # "BASE" text
-        text_base = font.render("BASE", True, COLOR_WHITE)
-        surface.blit(text_base, (self.x - 20, self.y - 30))
+        surface.blit(BaseCamp._label, (self.x - 20, self.y - 30))
+    
+    def draw_count(self, surface: pygame.Surface) -> None:
+        """Draw the stored resource count"""
+        if BaseCamp._font is None:
+            BaseCamp._font = pygame.font.Font(None, 24)
+            BaseCamp._label = BaseCamp._font.render("BASE", True, COLOR_WHITE)
         
-        # Resource count
-        text_resources = font.render(f"{self.resources_stored}", True, COLOR_WHITE)
-        surface.blit(text_resources, (self.x - 10, self.y + 5))
+        if self.resources_stored != self._count_value:
+            self._count_value = self.resources_stored
+            self._count_surface = BaseCamp._font.render(f"{self.resources_stored}", True, COLOR_WHITE)
+        surface.blit(self._count_surface, (self.x - 10, self.y + 5))
     
     def reset(self) -> None:
         """Reset base camp"""
         self.resources_stored = RESOURCES_INITIAL_COUNT
+        self.version += 1
         self.resources_stolen = 0
         self.breach_count = 0
         self.last_breach_time = None
@@ -138,6 +163,9 @@ class BaseCamp:
 class ThiefHideout:
     """Represents the thief's hideout"""
     
+    # Static "HIDEOUT" text, rendered on first draw
+    _label = None
+    
     def __init__(self, x: float = HIDEOUT_X, y: float = HIDEOUT_Y):
         """
         Initialize the thief hideout
@@ -190,9 +218,9 @@ class ThiefHideout:
         pygame.draw.circle(surface, COLOR_RED, (int(self.x), int(self.y)), self.size, 3)
         
         # Draw hideout label
-        font = pygame.font.Font(None, 20)
-        text = font.render("HIDEOUT", True, COLOR_WHITE)
-        surface.blit(text, (self.x - 30, self.y - 10))
+        if ThiefHideout._label is None:
+            ThiefHideout._label = pygame.font.Font(None, 20).render("HIDEOUT", True, COLOR_WHITE)
+        surface.blit(ThiefHideout._label, (self.x - 30, self.y - 10))
     
     def reset(self) -> None:
         """Reset hideout"""
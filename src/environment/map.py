@@ -5,8 +5,32 @@ Handles map layout, obstacles, and spatial queries
 from typing import List, Tuple
 import pygame
 import random
+import numpy as np
 from config.game_config import *
-from src.utils.helpers import distance, clamp_position
+from src.utils.helpers import clamp_position
+from src.utils.spatial_hash import SpatialHashGrid
+
+
+# Probe directions for get_nearest_free_position, every 45 degrees
+_PROBE_ANGLES = np.radians(np.arange(0, 360, 45))
+_PROBE_COS = np.cos(_PROBE_ANGLES)
+_PROBE_SIN = np.sin(_PROBE_ANGLES)
+
+
+def _spiral_offsets(search_range: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Probe offsets ring by ring (every 5px out to search_range), in search order"""
+    rings = np.arange(1, search_range, 5)[:, None]
+    return (rings * _PROBE_COS).ravel(), (rings * _PROBE_SIN).ravel()
+
+
+# Offsets for the default search range, built once
+_SPIRAL_DX, _SPIRAL_DY = _spiral_offsets(50)
+
+# Obstacle grid cell size: at least the largest scattered obstacle
+_OBSTACLE_CELL_SIZE = max(OBSTACLE_SIZE_RANGE[1], 64)
+
+# Side length in pixels of one explored-map cell
+_EXPLORED_CELL_SIZE = 10
 
 
 class Obstacle:
@@ -27,6 +51,10 @@ class Obstacle:
         self.y = y
         self.width = width
         self.height = height
+        
+        # Far edges, cached since obstacles never move
+        self.x2 = x + width
+        self.y2 = y + height
     
     def contains_point(self, x: float, y: float) -> bool:
         """Check if point is inside obstacle"""
@@ -34,13 +62,10 @@ class Obstacle:
     
     def contains_circle(self, x: float, y: float, radius: float) -> bool:
         """Check if circle overlaps with obstacle"""
-        # Find closest point on rectangle to circle center
-        closest_x = max(self.x, min(x, self.x + self.width))
-        closest_y = max(self.y, min(y, self.y + self.height))
-        
-        # Distance between circle center and closest point
-        dist = distance((x, y), (closest_x, closest_y))
-        return dist < radius
+        # Offset from the closest point on the rectangle to the circle center
+        dx = x - max(self.x, min(x, self.x2))
+        dy = y - max(self.y, min(y, self.y2))
+        return dx * dx + dy * dy < radius * radius
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw obstacle on surface"""
@@ -62,7 +87,19 @@ class GameMap:
         self.width = width
         self.height = height
         self.obstacles: List[Obstacle] = []
-        self.explored_areas = set()
+        
+        # One flag per explored-map cell, indexed [column, row]
+        self.explored = np.zeros((width // _EXPLORED_CELL_SIZE + 1, height // _EXPLORED_CELL_SIZE + 1),
+                                 dtype=bool)
+        
+        # Obstacle bounds (xmin, ymin, xmax, ymax), row i matching self.obstacles[i]
+        self.obs_aabb = np.empty((0, 4), dtype=np.float64)
+        
+        # Obstacles bucketed by the grid cells they overlap, for is_blocked
+        self.obstacle_grid = SpatialHashGrid(_OBSTACLE_CELL_SIZE)
+        
+        # Obstacle rects in draw order
+        self._obstacle_rects: List[pygame.Rect] = []
         
         self._generate_obstacles()
     
@@ -110,6 +147,19 @@ class GameMap:
                     break
             
             self.obstacles.append(Obstacle(x, y, width, height))
+        
+        self._rebuild_aabb()
+    
+    def _rebuild_aabb(self) -> None:
+        """Rebuild the obstacle bounds array, grid and draw rects from the obstacle list"""
+        self.obs_aabb = np.array([(obs.x, obs.y, obs.x2, obs.y2) for obs in self.obstacles],
+                                 dtype=np.float64).reshape(-1, 4)
+        
+        self.obstacle_grid.clear()
+        for obs in self.obstacles:
+            self.obstacle_grid.insert(obs, obs.x, obs.y, obs.width, obs.height)
+        
+        self._obstacle_rects = [obs.rect for obs in self.obstacles]
     
     def is_blocked(self, x: float, y: float, radius: float = 5) -> bool:
         """
@@ -123,11 +173,32 @@ class GameMap:
         Returns:
             True if blocked
         """
-        for obstacle in self.obstacles:
-            if obstacle.contains_circle(x, y, radius):
+        # Only obstacles in the cells around the circle can touch it
+        radius_sq = radius * radius
+        for obs in self.obstacle_grid.query(x, y, radius):
+            dx = x - min(max(x, obs.x), obs.x2)
+            dy = y - min(max(y, obs.y), obs.y2)
+            if dx * dx + dy * dy < radius_sq:
                 return True
         return False
     
+    def circles_blocked(self, xs: np.ndarray, ys: np.ndarray, radius: float) -> np.ndarray:
+        """
+        Check several circle positions against all obstacles in one pass
+        
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
+            radius: Collision radius
+            
+        Returns:
+            Boolean array, True where the circle overlaps an obstacle
+        """
+        aabb = self.obs_aabb
+        dx = xs[:, None] - np.clip(xs[:, None], aabb[:, 0], aabb[:, 2])
+        dy = ys[:, None] - np.clip(ys[:, None], aabb[:, 1], aabb[:, 3])
+        return (dx * dx + dy * dy < radius * radius).any(axis=1)
+    
     def get_nearest_free_position(self, x: float, y: float, radius: float = 5,
                                    search_range: int = 50) -> Tuple[float, float]:
         """
@@ -145,18 +216,18 @@ class GameMap:
         if not self.is_blocked(x, y, radius):
             return (x, y)
         
-        # Spiral search for free position
-        for distance_offset in range(1, search_range, 5):
-            for angle_step in range(0, 360, 45):
-                import math
-                angle = math.radians(angle_step)
-                new_x = x + distance_offset * math.cos(angle)
-                new_y = y + distance_offset * math.sin(angle)
-                
-                new_x, new_y = clamp_position((new_x, new_y), self.width, self.height)
-                
-                if not self.is_blocked(new_x, new_y, radius):
-                    return (new_x, new_y)
+        # Spiral search for free position, testing every probe at once
+        if search_range == 50:
+            offset_x, offset_y = _SPIRAL_DX, _SPIRAL_DY
+        else:
+            offset_x, offset_y = _spiral_offsets(search_range)
+        probe_x = np.clip(x + offset_x, 0, self.width)
+        probe_y = np.clip(y + offset_y, 0, self.height)
+        
+        free = np.flatnonzero(~self.circles_blocked(probe_x, probe_y, radius))
+        if free.size:
+            i = free[0]
+            return (float(probe_x[i]), float(probe_y[i]))
         
         return clamp_position((x, y), self.width, self.height)
     
@@ -169,11 +240,13 @@ class GameMap:
             y: Y coordinate of exploration
             radius: Exploration radius
         """
-        # Add cells within radius to explored set
-        step = 10
-        for dx in range(-int(radius), int(radius) + 1, step):
-            for dy in range(-int(radius), int(radius) + 1, step):
-                self.explored_areas.add((int(x + dx), int(y + dy)))
+        # Flag every cell in the square around the point
+        cell = _EXPLORED_CELL_SIZE
+        gx0 = max(int(x - radius) // cell, 0)
+        gy0 = max(int(y - radius) // cell, 0)
+        gx1 = int(x + radius) // cell + 1
+        gy1 = int(y + radius) // cell + 1
+        self.explored[gx0:gx1, gy0:gy1] = True
     
     def is_explored(self, x: float, y: float) -> bool:
         """
@@ -186,7 +259,11 @@ class GameMap:
         Returns:
             True if explored
         """
-        return (int(x), int(y)) in self.explored_areas
+        gx = int(x) // _EXPLORED_CELL_SIZE
+        gy = int(y) // _EXPLORED_CELL_SIZE
+        if 0 <= gx < self.explored.shape[0] and 0 <= gy < self.explored.shape[1]:
+            return bool(self.explored[gx, gy])
+        return False
     
     def get_obstacles(self) -> List[Obstacle]:
         """Get all obstacles"""
@@ -202,15 +279,23 @@ class GameMap:
         """
         # Draw explored areas (debug)
         if show_explored and DEBUG_MODE:
-            for x, y in self.explored_areas:
-                pygame.draw.circle(surface, (100, 100, 100), (x, y), 3)
+            self.draw_explored(surface)
         
-        # Draw obstacles
-        for obstacle in self.obstacles:
-            obstacle.draw(surface)
+        # Draw obstacles (surface.fill is a cheaper solid fill than draw.rect)
+        fill = surface.fill
+        draw_rect = pygame.draw.rect
+        for rect in self._obstacle_rects:
+            fill(COLOR_DARK_GRAY, rect)
+            draw_rect(surface, COLOR_GRAY, rect, 2)
+    
+    def draw_explored(self, surface: pygame.Surface) -> None:
+        """Mark every explored cell (debug overlay)"""
+        cell = _EXPLORED_CELL_SIZE
+        for gx, gy in np.argwhere(self.explored):
+            pygame.draw.circle(surface, (100, 100, 100), (gx * cell, gy * cell), 3)
     
     def reset(self) -> None:
         """Reset the map"""
         self.obstacles.clear()
-        self.explored_areas.clear()
+        self.explored[:] = False
         self._generate_obstacles()
@@ -2,17 +2,28 @@
 Resource Management System
 Handles resource spawning, collection, and tracking
 """
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 import pygame
 import random
+import numpy as np
 from config.game_config import *
-from src.utils.helpers import distance, is_in_range
+from src.utils.quadtree import QuadTree
+from src.utils.spatial_hash import SpatialHashGrid
+
+
+# Candidate spawn points drawn (and collision-tested) together per spawn attempt
+_SPAWN_CANDIDATES = 32
 
 
 class Resource:
     """Represents a collectible resource on the map"""
     
-    def __init__(self, x: float, y: float, resource_id: str):
+    __slots__ = ('x', 'y', 'id', 'uid')
+    
+    # Pre-rendered resource image shared by all resources, built on first draw
+    _sprite = None
+    
+    def __init__(self, x: float, y: float, resource_id: str, uid: int = 0):
         """
         Initialize a resource
         
@@ -20,21 +31,32 @@ class Resource:
             x: X coordinate
             y: Y coordinate
             resource_id: Unique identifier for the resource
+            uid: Unique integer identifier (the spawn counter)
         """
         self.x = x
         self.y = y
         self.id = resource_id
-        self.collected = False
-        self.collection_time = 0
+        self.uid = uid
     
     def get_position(self) -> Tuple[float, float]:
         """Get resource position"""
         return (self.x, self.y)
     
+    @classmethod
+    def sprite(cls) -> pygame.Surface:
+        """Get the shared resource image, centered at (RESOURCE_SIZE + 1, RESOURCE_SIZE + 1)"""
+        if cls._sprite is None:
+            size = 2 * RESOURCE_SIZE + 2
+            center = (RESOURCE_SIZE + 1, RESOURCE_SIZE + 1)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, COLOR_YELLOW, center, RESOURCE_SIZE)
+            pygame.draw.circle(sprite, COLOR_ORANGE, center, RESOURCE_SIZE, 2)
+            cls._sprite = sprite
+        return cls._sprite
+    
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the resource"""
-        pygame.draw.circle(surface, COLOR_YELLOW, (int(self.x), int(self.y)), RESOURCE_SIZE)
-        pygame.draw.circle(surface, COLOR_ORANGE, (int(self.x), int(self.y)), RESOURCE_SIZE, 2)
+        surface.blit(Resource.sprite(), (int(self.x) - RESOURCE_SIZE - 1, int(self.y) - RESOURCE_SIZE - 1))
     
     def __repr__(self):
         return f"Resource({self.id}, {self.x}, {self.y})"
@@ -45,11 +67,32 @@ class ResourceManager:
     
     def __init__(self):
         """Initialize resource manager"""
-        self.resources: List[Resource] = []
+        self.resources: List[Resource] = []  # active (uncollected) resources only
+        self._slots: Dict[int, int] = {}  # resource uid -> index in self.resources
         self.resource_counter = 0
         self.base_resources = RESOURCES_INITIAL_COUNT
         self.resources_collected = 0
         self.spawn_timer = 0
+        
+        # Generator for batched spawn-position draws, seeded from `random` so
+        # random.seed() still reproduces a game
+        self._rng = np.random.default_rng(random.getrandbits(64))
+        
+        # Spatial index over active resources, kept in sync on spawn/collect
+        self.index = QuadTree(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        
+        # Active resources bucketed by vision-range cells, for radius queries
+        self.grid = SpatialHashGrid(AGENT_VISION_RANGE)
+        
+        # Resource positions as an (N, 2) array, row i matching self.resources[i]
+        self.res_xy = np.empty((0, 2), dtype=np.float32)
+        
+        # Bumped whenever the set of active resources changes (never reset)
+        self.version = 0
+    
+    def _sync_arrays(self) -> None:
+        """Rebuild the position array after resources are added or removed"""
+        self.res_xy = np.array([(r.x, r.y) for r in self.resources], dtype=np.float32).reshape(-1, 2)
     
     def initialize_resources(self, map_obj) -> None:
         """
@@ -68,16 +111,22 @@ class ResourceManager:
         Args:
             map_obj: GameMap object for collision checking
         """
-        # Try to spawn in a free area
-        for _ in range(10):  # Try up to 10 times
-            x = random.randint(50, WINDOW_WIDTH - 50)
-            y = random.randint(50, WINDOW_HEIGHT - 50)
-            
-            if not map_obj.is_blocked(x, y, RESOURCE_SIZE):
-                resource = Resource(x, y, f"resource_{self.resource_counter}")
-                self.resources.append(resource)
-                self.resource_counter += 1
-                return
+        # Draw a batch of candidates and take the first one in a free area
+        xs = self._rng.integers(50, WINDOW_WIDTH - 50, _SPAWN_CANDIDATES, endpoint=True)
+        ys = self._rng.integers(50, WINDOW_HEIGHT - 50, _SPAWN_CANDIDATES, endpoint=True)
+        free = np.flatnonzero(~map_obj.circles_blocked(xs, ys, RESOURCE_SIZE))
+        if free.size == 0:
+            return
+        x, y = int(xs[free[0]]), int(ys[free[0]])
+        
+        resource = Resource(x, y, f"resource_{self.resource_counter}", self.resource_counter)
+        self._slots[resource.uid] = len(self.resources)
+        self.resources.append(resource)
+        self.index.insert(resource, x, y)
+        self.grid.insert(resource, x, y)
+        self.res_xy = np.concatenate((self.res_xy, np.array([[x, y]], dtype=np.float32)))
+        self.version += 1
+        self.resource_counter += 1
     
     def update(self, map_obj) -> None:
         """
@@ -107,8 +156,11 @@ class ResourceManager:
         Returns:
             Resource if found, None otherwise
         """
-        for resource in self.resources:
-            if not resource.collected and distance((x, y), resource.get_position()) < radius:
+        radius_sq = radius * radius
+        for resource in self.grid.query(x, y, radius):
+            dx = resource.x - x
+            dy = resource.y - y
+            if dx * dx + dy * dy < radius_sq:
                 return resource
         return None
     
@@ -122,20 +174,44 @@ class ResourceManager:
         Returns:
             True if successfully collected
         """
-        if resource in self.resources and not resource.collected:
-            resource.collected = True
-            self.resources.remove(resource)
-            self.resources_collected += 1
-            return True
-        return False
+        resources = self.resources
+        i = self._slots.get(resource.uid)
+        if i is None or resources[i] is not resource:
+            return False  # already collected
+        
+        # Swap-pop so the list and the position array stay compact and aligned
+        del self._slots[resource.uid]
+        last = resources.pop()
+        res_xy = self.res_xy[:-1].copy()
+        if i < len(resources):
+            resources[i] = last
+            self._slots[last.uid] = i
+            res_xy[i] = self.res_xy[-1]
+        self.res_xy = res_xy
+        
+        self.index.remove(resource, resource.x, resource.y)
+        self.grid.remove(resource, resource.x, resource.y)
+        self.resources_collected += 1
+        self.version += 1
+        return True
+    
+    def positions_array(self) -> np.ndarray:
+        """
+        Get the positions of all active resources
+        
+        Returns:
+            (N, 2) float32 array, row i matching self.resources[i]; replaced
+            rather than modified when resources change, so callers may keep it
+        """
+        return self.res_xy
     
     def get_uncollected_resources(self) -> List[Resource]:
-        """Get list of uncollected resources"""
-        return [r for r in self.resources if not r.collected]
+        """Get list of uncollected resources (the live list; do not modify)"""
+        return self.resources
     
     def get_resource_count(self) -> int:
         """Get total uncollected resource count"""
-        return len(self.get_uncollected_resources())
+        return len(self.resources)
     
     def get_resources_in_area(self, x: float, y: float, radius: float) -> List[Resource]:
         """
@@ -149,8 +225,14 @@ class ResourceManager:
         Returns:
             List of resources in area
         """
-        return [r for r in self.get_uncollected_resources()
-                if distance((x, y), r.get_position()) < radius]
+        radius_sq = radius * radius
+        found = []
+        for resource in self.grid.query(x, y, radius):
+            dx = resource.x - x
+            dy = resource.y - y
+            if dx * dx + dy * dy < radius_sq:
+                found.append(resource)
+        return found
     
     def get_nearest_resource(self, x: float, y: float) -> 'Resource':
         """
@@ -163,21 +245,24 @@ class ResourceManager:
         Returns:
             Nearest resource or None
         """
-        uncollected = self.get_uncollected_resources()
-        if not uncollected:
-            return None
-        
-        return min(uncollected, key=lambda r: distance((x, y), r.get_position()))
+        return self.index.query_nearest(x, y)
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw all resources"""
-        for resource in self.resources:
-            if not resource.collected:
-                resource.draw(surface)
+        sprite = Resource.sprite()
+        offset = RESOURCE_SIZE + 1
+        surface.blits([(sprite, (int(r.x) - offset, int(r.y) - offset)) for r in self.resources],
+                      doreturn=False)
     
     def reset(self) -> None:
         """Reset resource manager"""
         self.resources.clear()
+        self._slots.clear()
+        self.index.clear()
+        self.grid.clear()
+        self._sync_arrays()
+        self.version += 1
         self.resource_counter = 0
         self.resources_collected = 0
         self.spawn_timer = 0
+        self._rng = np.random.default_rng(random.getrandbits(64))
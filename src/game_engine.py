@@ -2,22 +2,31 @@
 Main Game Engine
 Central game loop and management
 """
+import math
 import pygame
 import random
 from typing import List, Dict
 from config.game_config import *
 from src.player import Player
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import BaseAgent, obstacle_cache
 from src.agents.explorer import ExplorerAgent
 from src.agents.collector import CollectorAgent
 from src.agents.attacker import AttackerAgent
 from src.agents.strategist import StrategistAgent
+from src.agents.swarm import AgentSwarm
 from src.environment.map import GameMap
 from src.environment.resource import ResourceManager
 from src.environment.base_camp import BaseCamp, ThiefHideout
 from src.communication.blackboard import get_blackboard
 from src.ui.ui_manager import UIManager
-from src.utils.helpers import distance, is_in_range
+from src.utils.helpers import TAU
+
+
+# Game time advanced per update, in seconds
+_FRAME_DT = 1.0 / FPS
+
+# Frames between sweeps of stale messages (5 seconds at 60 FPS)
+_MESSAGE_GC_INTERVAL = 300
 
 
 class GameEngine:
@@ -44,6 +53,15 @@ class GameEngine:
         # Game entities
         self.player: Player = None
         self.agents: List[BaseAgent] = []
+        
+        # Agents bucketed by role at spawn, with their rows in self.agents / self.swarm
+        self._strategists: List[StrategistAgent] = []
+        self._explorers: List[ExplorerAgent] = []
+        self._collectors: List[CollectorAgent] = []
+        self._attackers: List[AttackerAgent] = []
+        self._explorer_rows: List[int] = []
+        self._attacker_rows: List[int] = []
+        self.swarm = AgentSwarm()
         self.map: GameMap = None
         self.resource_manager: ResourceManager = None
         self.base_camp: BaseCamp = None
@@ -54,6 +72,8 @@ class GameEngine:
         self.ui_manager = UIManager()
         self.game_messages = []
         self.communication_log = []  # Track all agent communications
+        self._communication_log_set = set()  # same entries, for duplicate checks
+        self._messages_seen = 0  # delivered-message count (blackboard.messages_sent) at the last capture
         
         # Initialize game (but don't create entities yet - will do when difficulty is selected)
         self._setup_game_world()
@@ -62,10 +82,15 @@ class GameEngine:
         """Setup base game world components"""
         # Create map
         self.map = GameMap(WINDOW_WIDTH, WINDOW_HEIGHT)
+        self._background: pygame.Surface = None  # Rendered on first draw
+        obstacle_cache.refresh(self.map.get_obstacles())
         
         # Create resource manager
         self.resource_manager = ResourceManager()
         self.resource_manager.initialize_resources(self.map)
+        self._posted_resources_version = -1  # resource_manager.version last posted
+        self._posted_base_version = -1  # base_camp.version last posted
+        self._gc_countdown = _MESSAGE_GC_INTERVAL  # frames until the next message sweep
         
         # Create base camp and hideout
         self.base_camp = BaseCamp(BASE_CAMP_X, BASE_CAMP_Y)
@@ -78,6 +103,10 @@ class GameEngine:
         """Initialize all game components for a new game"""
         # Reset blackboard for new game
         self.blackboard.reset()
+        self._messages_seen = 0
+        self._posted_resources_version = -1
+        self._posted_base_version = -1
+        self._gc_countdown = _MESSAGE_GC_INTERVAL
         self.elapsed_time = 0
         self.frame_count = 0
         self.game_state = GAME_STATE_RUNNING
@@ -101,7 +130,6 @@ class GameEngine:
     def _spawn_agents(self) -> None:
         """Spawn AI agents based on current difficulty"""
         self.agents = []
-        import math
         
         # Get difficulty settings
         if self.current_difficulty == "easy":
@@ -118,16 +146,17 @@ class GameEngine:
         # Spawn explorers
         num_explorers = difficulty_config.get("explorers", 1)
         for i in range(num_explorers):
-            angle = i * (2 * 3.14159 / max(num_explorers, 1))
+            angle = i * (TAU / max(num_explorers, 1))
             x = BASE_CAMP_X + 150 * math.cos(angle)
             y = BASE_CAMP_Y + 150 * math.sin(angle)
             explorer = ExplorerAgent(f"agent_explorer_{i}", x, y)
+            explorer.reported_resources = set()  # uids of resources already reported
             self.agents.append(explorer)
         
         # Spawn collectors
         num_collectors = difficulty_config.get("collectors", 1)
         for i in range(num_collectors):
-            angle = (i + 1) * (2 * 3.14159 / max(num_collectors, 1))
+            angle = (i + 1) * (TAU / max(num_collectors, 1))
             x = BASE_CAMP_X + 150 * math.cos(angle)
             y = BASE_CAMP_Y + 150 * math.sin(angle)
             collector = CollectorAgent(f"agent_collector_{i}", x, y, self.base_camp, self.resource_manager)
@@ -137,7 +166,7 @@ class GameEngine:
         num_attackers = difficulty_config.get("attackers", 1)
         for i in range(num_attackers):
             # Position attackers around base
-            angle = i * (2 * 3.14159 / max(num_attackers, 1))
+            angle = i * (TAU / max(num_attackers, 1))
             attacker = AttackerAgent(f"agent_attacker_{i}", BASE_CAMP_X, BASE_CAMP_Y)
             self.agents.append(attacker)
         
@@ -146,6 +175,18 @@ class GameEngine:
             if isinstance(agent, StrategistAgent):
                 continue
             strategist.register_agent(agent.id, agent.role)
+        
+        self._bucket_agents()
+        self.swarm.bind(self.agents)
+    
+    def _bucket_agents(self) -> None:
+        """Split self.agents into the per-role lists"""
+        self._strategists = [agent for agent in self.agents if isinstance(agent, StrategistAgent)]
+        self._explorers = [agent for agent in self.agents if isinstance(agent, ExplorerAgent)]
+        self._collectors = [agent for agent in self.agents if isinstance(agent, CollectorAgent)]
+        self._attackers = [agent for agent in self.agents if isinstance(agent, AttackerAgent)]
+        self._explorer_rows = [i for i, agent in enumerate(self.agents) if isinstance(agent, ExplorerAgent)]
+        self._attacker_rows = [i for i, agent in enumerate(self.agents) if isinstance(agent, AttackerAgent)]
     
     def handle_events(self) -> bool:
         """
@@ -192,7 +233,7 @@ class GameEngine:
         if self.game_state != GAME_STATE_RUNNING:
             return
         
-        self.elapsed_time += 1 / FPS
+        self.elapsed_time += _FRAME_DT
         self.frame_count += 1
         
         # Handle player input
@@ -200,15 +241,17 @@ class GameEngine:
         self.player.handle_input(keys)
         
         # Update player
-        self.player.update(self.map.get_obstacles())
+        obstacles = self.map.get_obstacles()
+        self.player.update(obstacles)
         
         # Update resources
         self.resource_manager.update(self.map)
         
         # Update agents
         for agent in self.agents:
-            agent.update(self.map.get_obstacles())
+            agent.update(obstacles)
             agent.think()
+        self.swarm.sync()
         
         # Resource discovery: Explorers scan for resources
         self._scan_resources_for_explorers()
@@ -227,88 +270,87 @@ class GameEngine:
     
     def _scan_resources_for_explorers(self) -> None:
         """Explorers scan for resources within their vision range"""
-        from src.agents.explorer import ExplorerAgent
-        from config.game_config import AGENT_ROLE_EXPLORER
-        
-        # Find all explorer agents
-        explorers = [agent for agent in self.agents if isinstance(agent, ExplorerAgent) or agent.role == AGENT_ROLE_EXPLORER]
+        # Report every resource within an explorer's vision range, once per explorer
+        for explorer, resource in self._explorer_sightings(self._explorers):
+            if resource.uid not in explorer.reported_resources:
+                # Report to strategist
+                explorer.report_resource(resource.x, resource.y)
+                explorer.reported_resources.add(resource.uid)
+    
+    def _explorer_sightings(self, explorers: List[BaseAgent]) -> List[tuple]:
+        """
+        Find the resources each explorer can see
         
-        # For each explorer, scan for nearby resources
-        for explorer in explorers:
-            # Get all resources currently on map
-            all_resources = self.resource_manager.resources
+        Args:
+            explorers: Explorer agents
             
-            # Check each resource
-            for resource in all_resources:
-                # Calculate distance from explorer to resource
-                dx = resource.x - explorer.x
-                dy = resource.y - explorer.y
-                distance = (dx**2 + dy**2)**0.5
-                
-                # If resource is within vision range and not yet reported
-                if distance <= explorer.vision_range:
-                    resource_id = f"{resource.x}_{resource.y}"
-                    
-                    # Check if we already reported this resource
-                    if not hasattr(explorer, 'reported_resources'):
-                        explorer.reported_resources = set()
-                    
-                    if resource_id not in explorer.reported_resources:
-                        # Report to strategist
-                        explorer.report_resource(resource.x, resource.y)
-                        explorer.reported_resources.add(resource_id)
+        Returns:
+            List of (explorer, resource) pairs
+        """
+        # Only the resources in the grid cells around each explorer can be in range
+        grid = self.resource_manager.grid
+        sightings = []
+        for explorer in explorers:
+            ex, ey, vision_sq = explorer.x, explorer.y, explorer.vision_range_sq
+            for resource in grid.query(ex, ey, explorer.vision_range):
+                dx = resource.x - ex
+                dy = resource.y - ey
+                if dx * dx + dy * dy <= vision_sq:
+                    sightings.append((explorer, resource))
+        return sightings
     
     def _capture_communications(self) -> None:
         """Capture and log agent communications"""
-        # Get all messages from blackboard
-        all_messages = self.blackboard.message_history
+        # Messages delivered since last capture (undelivered ones are never counted)
+        delivered = self.blackboard.messages_sent
+        new_count = delivered - self._messages_seen
+        if new_count <= 0:
+            return
+        self._messages_seen = delivered
         
-        # Check for new messages since last capture
-        for msg in all_messages[-5:]:  # Last 5 messages
-            if not msg.read:
-                continue
-                
+        for msg in self.blackboard.get_message_history(min(new_count, 5)):  # At most the last 5
             # Format message for display
             sender_name = msg.sender.replace("agent_", "").upper()
             recipient_name = msg.recipient.replace("agent_", "").upper() if msg.recipient != "all" else "TEAM"
             
             if msg.message_type == "thief_sighted":
                 content = msg.content
-                log_msg = f"🎯 {sender_name} → {recipient_name}: THIEF SPOTTED at ({int(content.get('position', [0])[0])}, {int(content.get('position', [0])[1])})"
+                log_msg = f"🎯 {sender_name} → {recipient_name}: THIEF SPOTTED at ({int(content.position[0])}, {int(content.position[1])})"
                 
             elif msg.message_type == "resource_discovered":
                 content = msg.content
-                log_msg = f"📦 {sender_name} → {recipient_name}: RESOURCE FOUND at ({int(content.get('position', [0])[0])}, {int(content.get('position', [0])[1])})"
+                log_msg = f"📦 {sender_name} → {recipient_name}: RESOURCE FOUND at ({int(content.position[0])}, {int(content.position[1])})"
                 
             elif msg.message_type == "collect_resource":
                 content = msg.content
-                log_msg = f"📍 {sender_name} → {recipient_name}: COLLECT from ({int(content.get('position', [0])[0])}, {int(content.get('position', [0])[1])})"
+                log_msg = f"📍 {sender_name} → {recipient_name}: COLLECT from ({int(content.position[0])}, {int(content.position[1])})"
                 
             elif msg.message_type == "intercept_command":
                 content = msg.content
-                log_msg = f"⚔️  {sender_name} → {recipient_name}: INTERCEPT THIEF at ({int(content.get('target_position', [0])[0])}, {int(content.get('target_position', [0])[1])})"
+                log_msg = f"⚔️  {sender_name} → {recipient_name}: INTERCEPT THIEF at ({int(content.target_position[0])}, {int(content.target_position[1])})"
                 
             elif msg.message_type == "resources_delivered":
                 content = msg.content
-                log_msg = f"✅ {sender_name}: DELIVERED {content.get('count', 0)} resources"
+                log_msg = f"✅ {sender_name}: DELIVERED {content.count} resources"
                 
             else:
                 log_msg = f"📨 {sender_name} → {recipient_name}: {msg.message_type}"
             
             # Add to log if not already there
-            if log_msg not in self.communication_log:
+            if log_msg not in self._communication_log_set:
                 self.communication_log.append(log_msg)
+                self._communication_log_set.add(log_msg)
                 
                 # Keep only last 10 messages
                 if len(self.communication_log) > 10:
-                    self.communication_log.pop(0)
+                    self._communication_log_set.discard(self.communication_log.pop(0))
     
     def _check_player_interactions(self) -> None:
         """Check interactions between player and environment"""
         # Check if player is in base camp
         if self.base_camp.is_player_inside(self.player.x, self.player.y, self.player.size):
             # Player can steal resources
-            if len(self.player.carrying) < self.player.carrying_capacity:
+            if self.player.carrying_count < self.player.carrying_capacity:
                 stolen = self.player.steal_resources(1)
                 if stolen:
                     self.base_camp.remove_resources(1)
@@ -317,55 +359,61 @@ class GameEngine:
         # Check if player is in hideout
         if self.hideout.is_player_inside(self.player.x, self.player.y, self.player.size):
             self.player.secure_resources(self.hideout)
-            self.game_messages.append(f"Secured {len(self.player.carrying)} resources!")
+            self.game_messages.append(f"Secured {self.player.carrying_count} resources!")
         
         # Check if agent caught the player
-        for agent in self.agents:
-            if isinstance(agent, AttackerAgent):
-                if agent.check_thief_collision(self.player.x, self.player.y, self.player.size):
-                    self.game_state = GAME_STATE_AGENTS_WIN
-                    self.win_reason = "Attacker caught the thief!"
-                    self.game_messages.append("Thief caught! Agents win!")
-                    return
-        
-        # Check if explorers can see the player
-        for agent in self.agents:
-            if isinstance(agent, ExplorerAgent):
-                if agent.can_see(self.player.x, self.player.y) and self.player.is_visible():
-                    # Only report if not already reported recently
-                    if agent.detection_cooldown <= 0:
-                        agent.report_thief_sighting(self.player.x, self.player.y)
-        
-        # Check if explorer discovered the hideout
-        for agent in self.agents:
-            if isinstance(agent, ExplorerAgent):
-                # Check if explorer is in vision range of hideout
-                hideout_pos = self.hideout.get_position()
-                if agent.can_see(hideout_pos[0], hideout_pos[1]):
-                    # Explorer found the hideout - agents win immediately
-                    self.game_state = GAME_STATE_AGENTS_WIN
-                    self.win_reason = "Explorer found the thief's hideout!"
-                    self.game_messages.append("Hideout discovered! Agents win!")
-                    return
+        for agent in self._attackers:
+            if agent.check_thief_collision(self.player.x, self.player.y, self.player.size):
+                self.game_state = GAME_STATE_AGENTS_WIN
+                self.win_reason = "Attacker caught the thief!"
+                self.game_messages.append("Thief caught! Agents win!")
+                return
+        
+        # Vision checks for every agent at once
+        player_x, player_y = self.player.x, self.player.y
+        player_visible = self.player.is_visible()
+        sees_player = self.swarm.visible_from(player_x, player_y).tolist()
+        hideout_pos = self.hideout.get_position()
+        sees_hideout = self.swarm.visible_from(hideout_pos[0], hideout_pos[1]).tolist()
+        
+        # One pass over the explorers: report the player, note whether the hideout is seen
+        hideout_found = False
+        for row, agent in zip(self._explorer_rows, self._explorers):
+            # Only report if not already reported recently
+            if player_visible and sees_player[row] and agent.detection_cooldown <= 0:
+                agent.report_thief_sighting(player_x, player_y)
+            hideout_found = hideout_found or sees_hideout[row]
+        
+        if hideout_found:
+            # Explorer found the hideout - agents win immediately
+            self.game_state = GAME_STATE_AGENTS_WIN
+            self.win_reason = "Explorer found the thief's hideout!"
+            self.game_messages.append("Hideout discovered! Agents win!")
+            return
         
         # Check if attackers can see the player and pursue
-        for agent in self.agents:
-            if isinstance(agent, AttackerAgent):
-                # Check if attacker can see the thief directly
-                if agent.check_and_pursue_thief(self.player.x, self.player.y, self.player.is_visible()):
+        for row, agent in zip(self._attacker_rows, self._attackers):
+            if sees_player[row]:
+                # Attacker can see the thief directly
+                if agent.check_and_pursue_thief(player_x, player_y, player_visible):
                     # Attacker spotted the thief and will pursue
                     self.game_messages.append("Attacker spotted the thief!")
     
     def _check_win_conditions(self) -> None:
         """Check if any win condition is met"""
+        stored = self.base_camp.resources_stored
+        secured = self.hideout.secured_count
+        if stored > 0 and secured < WINNING_RESOURCES_FOR_THIEF:
+            return  # Common case: nobody has won yet
+        
         # Thief wins if all resources are stolen
-        if self.base_camp.get_resources() <= 0:
+        if stored <= 0:
             self.game_state = GAME_STATE_PLAYER_WIN
             self.win_reason = "Stole all resources from the base!"
             self.game_messages.append("Thief stole all resources! Thief wins!")
         
         # Thief wins if secured enough resources
-        if self.hideout.get_secured_resources() >= WINNING_RESOURCES_FOR_THIEF:
+        if secured >= WINNING_RESOURCES_FOR_THIEF:
             self.game_state = GAME_STATE_PLAYER_WIN
             self.win_reason = "Successfully secured all resources in hideout!"
             self.game_messages.append("Thief secured all resources! Thief wins!")
@@ -376,17 +424,36 @@ class GameEngine:
         if self.player.is_visible():
             pass  # Explorers will detect through their vision range
         
-        # Update resource count
-        self.blackboard.post_data("resources_at_base", self.base_camp.get_resources())
+        # Update resource count, only when deliveries or thefts changed it
+        if self.base_camp.version != self._posted_base_version:
+            self._posted_base_version = self.base_camp.version
+            self.blackboard.post_data("resources_at_base", self.base_camp.get_resources())
         
-        # Update resource locations
-        resources = self.resource_manager.get_uncollected_resources()
-        resource_positions = [r.get_position() for r in resources]
-        self.blackboard.post_data("resources_locations", resource_positions)
+        # Update resource locations, only when resources were spawned or collected
+        if self.resource_manager.version != self._posted_resources_version:
+            self._posted_resources_version = self.resource_manager.version
+            positions = self.resource_manager.positions_array().tolist()
+            self.blackboard.post_data("resources_locations", dict.fromkeys(map(tuple, positions)))
         
         # Clear old messages periodically
-        if self.frame_count % 300 == 0:  # Every 5 seconds
+        self._gc_countdown -= 1
+        if not self._gc_countdown:
             self.blackboard.clear_old_messages()
+            self._gc_countdown = _MESSAGE_GC_INTERVAL
+    
+    def _render_background(self) -> pygame.Surface:
+        """
+        Render everything that does not change during a game
+        
+        Returns:
+            Screen-sized surface with the map, base camp and hideout drawn on black
+        """
+        background = self.screen.copy()
+        background.fill(COLOR_BLACK)
+        self.map.draw(background)
+        self.base_camp.draw_static(background)
+        self.hideout.draw(background)
+        return background
     
     def draw(self) -> None:
         """Render game"""
@@ -396,17 +463,13 @@ class GameEngine:
             pygame.display.flip()
             return
         
-        # Clear screen
-        self.screen.fill(COLOR_BLACK)
-        
-        # Draw map
-        self.map.draw(self.screen, show_explored=SHOW_AGENT_VISION)
-        
-        # Draw base camp
-        self.base_camp.draw(self.screen)
-        
-        # Draw hideout
-        self.hideout.draw(self.screen)
+        # Static scenery (map, base camp, hideout) comes from one pre-rendered surface
+        if self._background is None:
+            self._background = self._render_background()
+        self.screen.blit(self._background, (0, 0))
+        if SHOW_AGENT_VISION and DEBUG_MODE:
+            self.map.draw_explored(self.screen)
+        self.base_camp.draw_count(self.screen)
         
         # Draw resources
         self.resource_manager.draw(self.screen)
@@ -414,13 +477,14 @@ class GameEngine:
         # Draw player
         self.player.draw(self.screen)
         
-        # Draw agents
-        for agent in self.agents:
+        # Draw agents (attackers are spawned last, so this keeps the draw order)
+        for group in (self._strategists, self._explorers, self._collectors):
+            for agent in group:
+                agent.draw(self.screen)
+        for agent in self._attackers:
             # Skip drawing inactive attackers
-            from src.agents.attacker import AttackerAgent
-            if isinstance(agent, AttackerAgent) and not agent.is_active:
-                continue
-            agent.draw(self.screen)
+            if agent.is_active:
+                agent.draw(self.screen)
         
         # Draw agent vision ranges
         self.ui_manager.draw_agent_vision_ranges(self.screen, self.agents)
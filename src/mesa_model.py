@@ -112,7 +112,7 @@ class OperationGuardianModel(Model):
         
         self.resources_collected = self.game_engine.player.resources_collected
         self.resources_at_base = self.game_engine.base_camp.get_resources()
-        self.agents_active = len([a for a in self.game_engine.agents if a.active])
+        self.agents_active = sum(1 for a in self.game_engine.agents if a.active)
     
     def get_game_state(self) -> Dict:
         """
@@ -154,7 +154,7 @@ class OperationGuardianModel(Model):
                 "role": agent.role,
                 "position": agent.get_position(),
                 "active": agent.active,
-                "carrying": len(agent.carrying),
+                "carrying": agent.carrying_count,
                 "target": agent.target_position,
             }
             agent_states.append(state)
@@ -176,7 +176,7 @@ class OperationGuardianModel(Model):
         return {
             "total_resources": len(resources),
             "resources_collected": self.game_engine.resource_manager.resources_collected,
-            "resources_active": len([r for r in resources if not r.collected]),
+            "resources_active": len(resources),
         }
 
 
@@ -4,12 +4,16 @@ The player-controlled thief character
 """
 import pygame
 from config.game_config import *
-from src.utils.helpers import clamp_position, distance
+from src.utils.helpers import clamp_position
 
 
 class Player:
     """Represents the player-controlled thief"""
     
+    # Rendered label and stealth caption shared by all players, built on first draw
+    _label = None
+    _stealth_label = None
+    
     def __init__(self, x: float = 50, y: float = 50):
         """
         Initialize the player
@@ -26,7 +30,7 @@ class Player:
         self.vy = 0
         
         # Inventory
-        self.carrying = []
+        self.carrying_count = 0  # Stolen resources being carried
         self.carrying_capacity = PLAYER_CARRYING_CAPACITY
         
         # Stealth ability
@@ -54,18 +58,15 @@ class Player:
         Args:
             keys: Pygame keys array from pygame.key.get_pressed()
         """
-        self.vx = 0
-        self.vy = 0
+        # WASD or Arrow keys for movement, each key read once
+        up = keys[pygame.K_w] | keys[pygame.K_UP]
+        down = keys[pygame.K_s] | keys[pygame.K_DOWN]
+        left = keys[pygame.K_a] | keys[pygame.K_LEFT]
+        right = keys[pygame.K_d] | keys[pygame.K_RIGHT]
         
-        # WASD or Arrow keys for movement
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.vy = -self.speed
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            self.vy = self.speed
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.vx = -self.speed
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.vx = self.speed
+        # Direction per axis is 1, -1 or 0; opposite keys cancel out
+        self.vy = self.speed * (down - up)
+        self.vx = self.speed * (right - left)
         
         # Stealth ability (SPACE)
         if keys[pygame.K_SPACE] and not self.stealth_active and self.stealth_cooldown <= 0:
@@ -84,7 +85,7 @@ class Player:
         
         # Check collision with obstacles
         if obstacles:
-            if not any(obs.contains_circle(new_x, new_y, self.size) for obs in obstacles):
+            if not self._hits_obstacle(new_x, new_y, obstacles):
                 self.set_position(new_x, new_y)
         else:
             self.set_position(new_x, new_y)
@@ -99,6 +100,31 @@ class Player:
         if self.stealth_cooldown > 0:
             self.stealth_cooldown -= 1
     
+    def _hits_obstacle(self, x: float, y: float, obstacles) -> bool:
+        """
+        Check if the player's circle at a position overlaps any obstacle
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            obstacles: List of obstacles
+            
+        Returns:
+            True if an obstacle is hit
+        """
+        r = self.size
+        r_sq = r * r
+        
+        for obs in obstacles:
+            # Cheap bounding-box rejection before the exact circle test
+            if x + r < obs.x or x - r > obs.x2 or y + r < obs.y or y - r > obs.y2:
+                continue
+            dx = x - min(max(x, obs.x), obs.x2)
+            dy = y - min(max(y, obs.y), obs.y2)
+            if dx * dx + dy * dy < r_sq:
+                return True
+        return False
+    
     def activate_stealth(self) -> None:
         """Activate stealth ability"""
         self.stealth_active = True
@@ -114,16 +140,14 @@ class Player:
         Returns:
             True if successfully stole resources
         """
-        if len(self.carrying) < self.carrying_capacity:
-            steal_amount = min(count, self.carrying_capacity - len(self.carrying))
-            for _ in range(steal_amount):
-                self.carrying.append({"value": RESOURCE_VALUE})
+        if self.carrying_count < self.carrying_capacity:
+            self.carrying_count += min(count, self.carrying_capacity - self.carrying_count)
             return True
         return False
     
     def get_carrying_count(self) -> int:
         """Get number of resources being carried"""
-        return len(self.carrying)
+        return self.carrying_count
     
     def secure_resources(self, hideout) -> bool:
         """
@@ -135,11 +159,11 @@ class Player:
         Returns:
             True if resources secured
         """
-        if len(self.carrying) > 0:
-            count = len(self.carrying)
+        if self.carrying_count > 0:
+            count = self.carrying_count
             hideout.secure_resources(count)
             self.resources_secured += count
-            self.carrying.clear()
+            self.carrying_count = 0
             return True
         return False
     
@@ -158,26 +182,25 @@ class Player:
         pygame.draw.circle(surface, outline_color, (int(self.x), int(self.y)), self.size, 2)
         
         # Draw carrying indicator
-        if len(self.carrying) > 0:
+        if self.carrying_count > 0:
             pygame.draw.circle(surface, COLOR_YELLOW, (int(self.x), int(self.y) - 15), 3)
         
         # Label
-        font = pygame.font.Font(None, 16)
-        label = font.render("T", True, COLOR_WHITE)
-        surface.blit(label, (self.x - 4, self.y - 4))
+        if Player._label is None:
+            Player._label = pygame.font.Font(None, 16).render("T", True, COLOR_WHITE)
+            Player._stealth_label = pygame.font.Font(None, 12).render("STEALTH", True, (100, 200, 255))
+        surface.blit(Player._label, (self.x - 4, self.y - 4))
         
         # Stealth indicator
         if self.stealth_active:
-            font_small = pygame.font.Font(None, 12)
-            stealth_text = font_small.render("STEALTH", True, (100, 200, 255))
-            surface.blit(stealth_text, (self.x - 25, self.y - 25))
+            surface.blit(Player._stealth_label, (self.x - 25, self.y - 25))
     
     def reset(self) -> None:
         """Reset player to initial state"""
         self.set_position(50, 50)
         self.vx = 0
         self.vy = 0
-        self.carrying.clear()
+        self.carrying_count = 0
         self.stealth_active = False
         self.stealth_timer = 0
         self.stealth_cooldown = 0
@@ -8,9 +8,20 @@ from config.game_config import *
 from src.utils.helpers import format_time
 
 
+# Rendered text surfaces kept before the cache is flushed
+_TEXT_CACHE_LIMIT = 256
+
+
 class UIManager:
     """Manages game UI and rendering"""
     
+    # Vision overlay color per role (strategists are not shown), with the overlay opacity as alpha
+    _VISION_COLORS = {
+        AGENT_ROLE_EXPLORER: (0, 150, 255, 50),  # Cyan
+        AGENT_ROLE_COLLECTOR: (255, 165, 0, 50),  # Orange
+        AGENT_ROLE_ATTACKER: (255, 0, 0, 50),  # Red
+    }
+    
     def __init__(self, width: int = WINDOW_WIDTH, height: int = WINDOW_HEIGHT):
         """
         Initialize UI manager
@@ -24,6 +35,46 @@ class UIManager:
         self.font_large = pygame.font.Font(None, FONT_SIZE_LARGE)
         self.font_medium = pygame.font.Font(None, FONT_SIZE_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SIZE_SMALL)
+        self._text_cache = {}  # (font id, text, color) -> rendered surface
+        self._timer_second = -1  # Whole second shown by _timer_text
+        self._timer_text: pygame.Surface = None
+        self._hud_readouts = None  # Counter and status values shown by _hud_texts
+        self._hud_texts = ()  # (surface, position) pairs
+        
+        # Static side panels, rendered on first draw
+        self._legend: pygame.Surface = None
+        self._objective_panel: pygame.Surface = None
+        
+        self._game_over_overlay: pygame.Surface = None
+        
+        # Persistent vision overlay and the rects drawn on it last frame
+        self._vision_surface: pygame.Surface = None
+        self._vision_dirty = []
+        
+        # Message log panel, and the messages last shown on it with their rendered lines
+        self._log_panel: pygame.Surface = None
+        self._log_shown = []
+        self._log_lines = []
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface from an identical earlier call
+        
+        Args:
+            font: One of this manager's fonts
+            text: Text to render
+            color: Text color
+            
+        Returns:
+            Rendered text surface
+        """
+        key = (id(font), text, color)
+        rendered = self._text_cache.get(key)
+        if rendered is None:
+            if len(self._text_cache) >= _TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            rendered = self._text_cache[key] = font.render(text, True, color)
+        return rendered
     
     def draw_hud(self, surface: pygame.Surface, game_state: dict) -> None:
         """
@@ -48,30 +99,38 @@ class UIManager:
         # Draw HUD information
         y_offset = UI_PADDING
         
-        # Timer
-        time_text = self.font_medium.render(f"Time: {format_time(elapsed_time)}", True, COLOR_WHITE)
-        surface.blit(time_text, (UI_PADDING, y_offset))
-        
-        # Resources at base
-        resources_text = self.font_medium.render(f"Base: {resources_at_base}", True, COLOR_GREEN)
-        surface.blit(resources_text, (self.width // 3, y_offset))
-        
-        # Resources at hideout
-        hideout_text = self.font_medium.render(f"Hideout: {resources_at_hideout}", True, COLOR_RED)
-        surface.blit(hideout_text, (self.width // 2 + 50, y_offset))
-        
-        # Player resources
-        player_text = self.font_medium.render(f"Carrying: {player_carrying}/{PLAYER_CARRYING_CAPACITY}", True, COLOR_CYAN)
-        surface.blit(player_text, (self.width - 250, y_offset))
-        
-        # Game status
-        status_color = COLOR_GREEN if game_status == "RUNNING" else COLOR_RED
-        status_text = self.font_small.render(game_status, True, status_color)
-        surface.blit(status_text, (self.width - UI_PADDING - 150, y_offset + 5))
+        # Timer (its text only changes once per second)
+        second = int(elapsed_time)
+        if second != self._timer_second:
+            self._timer_second = second
+            self._timer_text = self.font_medium.render(f"Time: {format_time(second)}", True, COLOR_WHITE)
+        surface.blit(self._timer_text, (UI_PADDING, y_offset))
+        
+        # Counters and status: format and render only when one of them changes
+        readouts = (resources_at_base, resources_at_hideout, player_carrying, game_status)
+        if readouts != self._hud_readouts:
+            self._hud_readouts = readouts
+            status_color = COLOR_GREEN if game_status == "RUNNING" else COLOR_RED
+            self._hud_texts = (
+                # Resources at base
+                (self._render_text(self.font_medium, f"Base: {resources_at_base}", COLOR_GREEN),
+                 (self.width // 3, y_offset)),
+                # Resources at hideout
+                (self._render_text(self.font_medium, f"Hideout: {resources_at_hideout}", COLOR_RED),
+                 (self.width // 2 + 50, y_offset)),
+                # Player resources
+                (self._render_text(self.font_medium, f"Carrying: {player_carrying}/{PLAYER_CARRYING_CAPACITY}",
+                                   COLOR_CYAN),
+                 (self.width - 250, y_offset)),
+                # Game status
+                (self._render_text(self.font_small, game_status, status_color),
+                 (self.width - UI_PADDING - 150, y_offset + 5)),
+            )
+        surface.blits(self._hud_texts, doreturn=False)
         
         # FPS display
         if SHOW_FPS:
-            fps_text = self.font_small.render(f"FPS: {game_state.get('fps', 0):.1f}", True, COLOR_YELLOW)
+            fps_text = self._render_text(self.font_small, f"FPS: {game_state.get('fps', 0):.1f}", COLOR_YELLOW)
             surface.blit(fps_text, (self.width - 100, UI_PADDING))
     
     def draw_game_over_screen(self, surface: pygame.Surface, winner: str, stats: dict) -> None:
@@ -84,10 +143,10 @@ class UIManager:
             stats: Game statistics
         """
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        if self._game_over_overlay is None:
+            self._game_over_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._game_over_overlay.fill((0, 0, 0, 200))
+        surface.blit(self._game_over_overlay, (0, 0))
         
         # Draw title
         if winner == "thief":
@@ -146,26 +205,19 @@ class UIManager:
             surface.blit(text, (x, y))
             y += 20
     
-    def draw_objective_panel(self, surface: pygame.Surface, role: str) -> None:
-        """
-        Draw objective panel
-        
-        Args:
-            surface: Pygame surface to draw on
-            role: Player role ('thief')
-        """
+    def _render_objective_panel(self) -> pygame.Surface:
+        """Render the (static) objective panel, origin at its top-left corner"""
         panel_width = 250
         panel_height = 100
-        panel_x = self.width - panel_width - 10
-        panel_y = 100
+        panel = pygame.Surface((panel_width, panel_height))
         
         # Draw panel background
-        pygame.draw.rect(surface, (20, 20, 20), (panel_x, panel_y, panel_width, panel_height))
-        pygame.draw.rect(surface, COLOR_CYAN, (panel_x, panel_y, panel_width, panel_height), 2)
+        pygame.draw.rect(panel, (20, 20, 20), (0, 0, panel_width, panel_height))
+        pygame.draw.rect(panel, COLOR_CYAN, (0, 0, panel_width, panel_height), 2)
         
         # Title
         title = self.font_medium.render("OBJECTIVES", True, COLOR_CYAN)
-        surface.blit(title, (panel_x + 10, panel_y + 5))
+        panel.blit(title, (10, 5))
         
         # Objectives based on role
         objectives = [
@@ -174,19 +226,27 @@ class UIManager:
             "• Secure loot at hideout",
         ]
         
-        y = panel_y + 30
+        y = 30
         for obj in objectives:
             text = self.font_small.render(obj, True, COLOR_WHITE)
-            surface.blit(text, (panel_x + 10, y))
+            panel.blit(text, (10, y))
             y += 20
+        return panel
     
-    def draw_legend(self, surface: pygame.Surface) -> None:
+    def draw_objective_panel(self, surface: pygame.Surface, role: str) -> None:
         """
-        Draw map legend
+        Draw objective panel
         
         Args:
             surface: Pygame surface to draw on
+            role: Player role ('thief')
         """
+        if self._objective_panel is None:
+            self._objective_panel = self._render_objective_panel()
+        surface.blit(self._objective_panel, (self.width - self._objective_panel.get_width() - 10, 100))
+    
+    def _render_legend(self) -> pygame.Surface:
+        """Render the (static) map legend, origin at its top-left corner"""
         legend_items = [
             (COLOR_GREEN_DARK, "Base Camp"),
             (COLOR_CYAN, "Player (Thief)"),
@@ -197,26 +257,37 @@ class UIManager:
             (COLOR_YELLOW, "Resource"),
         ]
         
-        panel_x = 10
-        panel_y = 100
         max_width = 180
         
         # Draw legend background
         legend_height = len(legend_items) * 20 + 20
-        pygame.draw.rect(surface, (20, 20, 20), (panel_x, panel_y, max_width, legend_height))
-        pygame.draw.rect(surface, COLOR_GRAY, (panel_x, panel_y, max_width, legend_height), 1)
+        legend = pygame.Surface((max_width, legend_height))
+        pygame.draw.rect(legend, (20, 20, 20), (0, 0, max_width, legend_height))
+        pygame.draw.rect(legend, COLOR_GRAY, (0, 0, max_width, legend_height), 1)
         
         # Draw legend title
         title = self.font_small.render("LEGEND", True, COLOR_WHITE)
-        surface.blit(title, (panel_x + 10, panel_y + 5))
+        legend.blit(title, (10, 5))
         
         # Draw legend items
-        y = panel_y + 25
+        y = 25
         for color, label in legend_items:
-            pygame.draw.circle(surface, color, (panel_x + 15, y), 4)
+            pygame.draw.circle(legend, color, (15, y), 4)
             text = self.font_small.render(label, True, COLOR_WHITE)
-            surface.blit(text, (panel_x + 30, y - 8))
+            legend.blit(text, (30, y - 8))
             y += 20
+        return legend
+    
+    def draw_legend(self, surface: pygame.Surface) -> None:
+        """
+        Draw map legend
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
+        if self._legend is None:
+            self._legend = self._render_legend()
+        surface.blit(self._legend, (10, 100))
     
     def draw_agent_vision_ranges(self, surface: pygame.Surface, agents: list) -> None:
         """
@@ -229,42 +300,38 @@ class UIManager:
         if not SHOW_AGENT_VISION:
             return
         
-        # Create a temporary surface for semi-transparent circles
-        vision_surface = pygame.Surface((self.width, self.height))
-        vision_surface.set_colorkey((0, 0, 0))
-        vision_surface.fill((0, 0, 0))
+        # Reuse one per-pixel alpha surface for the semi-transparent circles,
+        # clearing only the areas drawn last frame
+        vision_surface = self._vision_surface
+        if vision_surface is None:
+            vision_surface = self._vision_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for rect in self._vision_dirty:
+            vision_surface.fill((0, 0, 0, 0), rect)
+        dirty = self._vision_dirty = []
         
+        vision_colors = UIManager._VISION_COLORS
         for agent in agents:
             # Skip strategist - don't show their vision range
             if agent.role == AGENT_ROLE_STRATEGIST:
                 continue
             
             # Skip inactive attackers
-            from src.agents.attacker import AttackerAgent
-            if isinstance(agent, AttackerAgent) and not agent.is_active:
+            if agent.role == AGENT_ROLE_ATTACKER and not agent.is_active:
                 continue
             
-            # Get agent color based on role
-            if agent.role == AGENT_ROLE_EXPLORER:
-                color = (0, 150, 255, 100)  # Cyan
-            elif agent.role == AGENT_ROLE_COLLECTOR:
-                color = (255, 165, 0, 100)  # Orange
-            elif agent.role == AGENT_ROLE_ATTACKER:
-                color = (255, 0, 0, 100)  # Red
-            else:
-                color = (128, 128, 128, 100)  # Gray
+            color = vision_colors.get(agent.role, (128, 128, 128, 50))
+            center = (int(agent.x), int(agent.y))
             
-            # Draw vision range circle
-            pygame.draw.circle(vision_surface, color[:3], (int(agent.x), int(agent.y)), 
-                             agent.vision_range, 1)
+            # Draw vision range circle (its bounds also cover the filled circle)
+            dirty.append(pygame.draw.circle(vision_surface, color, center, agent.vision_range, 1))
             
             # Draw semi-transparent filled circle
-            pygame.draw.circle(vision_surface, color[:3], (int(agent.x), int(agent.y)), 
-                             agent.vision_range // 2, 0)
+            pygame.draw.circle(vision_surface, color, center, agent.vision_range // 2, 0)
         
-        # Set alpha and blend
-        vision_surface.set_alpha(50)
-        surface.blit(vision_surface, (0, 0))
+        # Blend; everything outside the drawn circles is fully transparent
+        if dirty:
+            area = dirty[0].unionall(dirty[1:])
+            surface.blit(vision_surface, area, area)
     
     def draw_message_log(self, surface: pygame.Surface, messages: list, max_messages: int = 8) -> None:
         """
@@ -280,27 +347,42 @@ class UIManager:
         
         panel_x = 10
         panel_y = self.height - 200
+        
+        # Panel background, border and title
+        if self._log_panel is None:
+            self._log_panel = self._render_log_panel()
+        surface.blit(self._log_panel, (panel_x, panel_y))
+        
+        # Truncate and render the shown messages only when they change
+        shown = messages[-max_messages:]
+        if shown != self._log_shown:
+            self._log_shown = shown
+            self._log_lines = [
+                self._render_text(self.font_small, message if len(message) <= 50 else message[:47] + "...",
+                                  COLOR_WHITE)
+                for message in shown
+            ]
+        
+        # Messages
+        y = panel_y + 25
+        for text in self._log_lines:
+            surface.blit(text, (panel_x + 10, y))
+            y += 20
+    
+    def _render_log_panel(self) -> pygame.Surface:
+        """Render the message log panel without its messages"""
         panel_width = 400
         panel_height = 190
+        panel = pygame.Surface((panel_width, panel_height))
         
         # Draw panel background
-        pygame.draw.rect(surface, (10, 10, 20), (panel_x, panel_y, panel_width, panel_height))
-        pygame.draw.rect(surface, (100, 150, 255), (panel_x, panel_y, panel_width, panel_height), 2)
+        pygame.draw.rect(panel, (10, 10, 20), (0, 0, panel_width, panel_height))
+        pygame.draw.rect(panel, (100, 150, 255), (0, 0, panel_width, panel_height), 2)
         
         # Title
         title = self.font_small.render("📡 COMMUNICATIONS LOG", True, (100, 200, 255))
-        surface.blit(title, (panel_x + 10, panel_y + 5))
-        
-        # Messages
-        y = panel_y + 25
-        for message in messages[-max_messages:]:
-            # Truncate if too long
-            if len(message) > 50:
-                message = message[:47] + "..."
-            
-            text = self.font_small.render(message, True, COLOR_WHITE)
-            surface.blit(text, (panel_x + 10, y))
-            y += 20
+        panel.blit(title, (10, 5))
+        return panel
     
     def draw_difficulty_selection(self, surface: pygame.Surface, selected_difficulty: str) -> None:
         """
@@ -3,8 +3,13 @@ Helper Functions and Utilities
 Common functions used throughout the game
 """
 import math
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 import random
+import numpy as np
+
+
+# Full turn in radians
+TAU = 2 * math.pi
 
 
 def distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
@@ -18,7 +23,25 @@ def distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
     Returns:
         Distance between points
     """
-    return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
+
+
+def distance_sq(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
+    """
+    Calculate squared Euclidean distance between two points
+    
+    Cheaper than distance() when only comparing against a threshold.
+    
+    Args:
+        pos1: First position (x, y)
+        pos2: Second position (x, y)
+        
+    Returns:
+        Squared distance between points
+    """
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    return dx * dx + dy * dy
 
 
 def direction(from_pos: Tuple[float, float], to_pos: Tuple[float, float]) -> Tuple[float, float]:
@@ -34,7 +57,7 @@ def direction(from_pos: Tuple[float, float], to_pos: Tuple[float, float]) -> Tup
     """
     dx = to_pos[0] - from_pos[0]
     dy = to_pos[1] - from_pos[1]
-    dist = distance(from_pos, to_pos)
+    dist = math.hypot(dx, dy)
     
     if dist == 0:
         return (0, 0)
@@ -55,10 +78,31 @@ def move_towards(from_pos: Tuple[float, float], to_pos: Tuple[float, float],
     Returns:
         New position
     """
-    dx, dy = direction(from_pos, to_pos)
-    new_x = from_pos[0] + dx * speed
-    new_y = from_pos[1] + dy * speed
-    return (new_x, new_y)
+    return move_towards_xy(from_pos[0], from_pos[1], to_pos[0], to_pos[1], speed)
+
+
+def move_towards_xy(x: float, y: float, target_x: float, target_y: float,
+                    speed: float) -> Tuple[float, float]:
+    """
+    Scalar-argument form of move_towards() for per-frame callers
+    
+    Args:
+        x, y: Current position
+        target_x, target_y: Target position
+        speed: Speed of movement
+        
+    Returns:
+        New position
+    """
+    # Same as direction(), inlined because this runs for every agent every frame
+    dx = target_x - x
+    dy = target_y - y
+    dist = math.hypot(dx, dy)
+    if dist == 0:
+        return (x, y)
+    
+    step = speed / dist
+    return (x + dx * step, y + dy * step)
 
 
 def angle_to(from_pos: Tuple[float, float], to_pos: Tuple[float, float]) -> float:
@@ -72,9 +116,7 @@ def angle_to(from_pos: Tuple[float, float], to_pos: Tuple[float, float]) -> floa
     Returns:
         Angle in radians
     """
-    dx = to_pos[0] - from_pos[0]
-    dy = to_pos[1] - from_pos[1]
-    return math.atan2(dy, dx)
+    return math.atan2(to_pos[1] - from_pos[1], to_pos[0] - from_pos[0])
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -104,8 +146,12 @@ def clamp_position(pos: Tuple[float, float], width: float, height: float) -> Tup
     Returns:
         Clamped position
     """
-    x = clamp(pos[0], 0, width)
-    y = clamp(pos[1], 0, height)
+    x, y = pos
+    if 0 <= x <= width and 0 <= y <= height:
+        return (x, y)  # Already in bounds (the common case)
+    
+    x = 0 if x < 0 else (width if x > width else x)
+    y = 0 if y < 0 else (height if y > height else y)
     return (x, y)
 
 
@@ -121,7 +167,33 @@ def is_in_range(pos1: Tuple[float, float], pos2: Tuple[float, float], range_val:
     Returns:
         True if within range
     """
-    return distance(pos1, pos2) <= range_val
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    
+    # Far apart along either axis: out of range without squaring anything
+    if abs(dx) > range_val or abs(dy) > range_val:
+        return False
+    return dx * dx + dy * dy <= range_val * range_val
+
+
+def in_range_batch(x0: float, y0: float, xs: np.ndarray, ys: np.ndarray,
+                   range_sq: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Check which of many points are within range of one point
+    
+    Args:
+        x0: X coordinate of the reference point
+        y0: Y coordinate of the reference point
+        xs: X coordinates of the other points
+        ys: Y coordinates of the other points
+        range_sq: Squared range threshold, shared or one per point
+        
+    Returns:
+        Boolean array, True where the point is within range
+    """
+    dx = xs - x0
+    dy = ys - y0
+    return dx * dx + dy * dy <= range_sq
 
 
 def random_position(width: float, height: float, margin: float = 0) -> Tuple[float, float]:
@@ -148,7 +220,7 @@ def random_direction() -> Tuple[float, float]:
     Returns:
         Normalized random direction (dx, dy)
     """
-    angle = random.uniform(0, 2 * math.pi)
+    angle = random.uniform(0, TAU)
     return (math.cos(angle), math.sin(angle))
 
 
@@ -166,7 +238,8 @@ def circle_overlap(pos1: Tuple[float, float], radius1: float,
     Returns:
         True if circles overlap
     """
-    return distance(pos1, pos2) < radius1 + radius2
+    radius_sum = radius1 + radius2
+    return distance_sq(pos1, pos2) < radius_sum * radius_sum
 
 
 def rect_overlap(rect1: Tuple[float, float, float, float],
@@ -202,8 +275,12 @@ def line_of_sight(from_pos: Tuple[float, float], to_pos: Tuple[float, float],
     Returns:
         True if line of sight exists
     """
-    # Check distance first
-    if distance(from_pos, to_pos) > sight_range:
+    # Check distance first, rejecting on a single axis before squaring
+    dx = to_pos[0] - from_pos[0]
+    dy = to_pos[1] - from_pos[1]
+    if abs(dx) > sight_range or abs(dy) > sight_range:
+        return False
+    if dx * dx + dy * dy > sight_range * sight_range:
         return False
     
     # Simple line of sight check - no obstacle intersection
@@ -228,9 +305,6 @@ def line_intersects_rect(p1: Tuple[float, float], p2: Tuple[float, float],
         True if line intersects rectangle
     """
     x, y, w, h = rect
-    
-    # Simple AABB line intersection
-    # Check if line from p1 to p2 intersects rectangle
     x1, y1 = p1
     x2, y2 = p2
     
@@ -238,12 +312,27 @@ def line_intersects_rect(p1: Tuple[float, float], p2: Tuple[float, float],
     left, top = x, y
     right, bottom = x + w, y + h
     
-    # Quick rejection test
+    # Quick rejection test: bounding boxes don't even overlap
     if max(x1, x2) < left or min(x1, x2) > right:
         return False
     if max(y1, y2) < top or min(y1, y2) > bottom:
         return False
     
+    # Liang-Barsky: clip the segment's parameter range [0, 1] against each slab
+    dx = x2 - x1
+    dy = y2 - y1
+    t_enter, t_exit = 0.0, 1.0
+    for p, q in ((-dx, x1 - left), (dx, right - x1), (-dy, y1 - top), (dy, bottom - y1)):
+        if p == 0:
+            if q < 0:
+                return False  # Parallel to this edge and outside it
+        elif p < 0:
+            t_enter = max(t_enter, q / p)
+        else:
+            t_exit = min(t_exit, q / p)
+        if t_enter > t_exit:
+            return False
+    
     return True
 
 
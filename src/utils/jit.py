@@ -0,0 +1,17 @@
+"""
+JIT Compilation Support
+Optional Numba acceleration with a pass-through fallback when it is not installed
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    # Provide fallback if Numba not installed
+    def njit(*args, **kwargs):
+        """Return the function unchanged (supports both @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,155 @@
+"""
+Point Quadtree
+Bucket quadtree over point items for nearest-neighbour queries
+"""
+from typing import Any, List, Optional, Tuple
+
+
+class QuadTree:
+    """Region quadtree node; leaves hold up to `capacity` (x, y, item) entries"""
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float,
+                 capacity: int = 4, max_depth: int = 8):
+        """
+        Initialize an empty node
+
+        Args:
+            x0, y0: Top-left corner of the node bounds
+            x1, y1: Bottom-right corner of the node bounds
+            capacity: Items a leaf holds before it splits
+            max_depth: Depth below which leaves never split
+        """
+        self.x0, self.y0, self.x1, self.y1 = x0, y0, x1, y1
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.entries: List[Tuple[float, float, Any]] = []
+        self.children: Optional[List['QuadTree']] = None
+        self.size = 0
+
+    def _child_for(self, x: float, y: float) -> 'QuadTree':
+        """Get the child quadrant containing a point"""
+        mx = (self.x0 + self.x1) * 0.5
+        my = (self.y0 + self.y1) * 0.5
+        return self.children[(2 if y >= my else 0) + (1 if x >= mx else 0)]
+
+    def _split(self) -> None:
+        """Turn a full leaf into four child quadrants"""
+        mx = (self.x0 + self.x1) * 0.5
+        my = (self.y0 + self.y1) * 0.5
+        depth = self.max_depth - 1
+        self.children = [
+            QuadTree(self.x0, self.y0, mx, my, self.capacity, depth),
+            QuadTree(mx, self.y0, self.x1, my, self.capacity, depth),
+            QuadTree(self.x0, my, mx, self.y1, self.capacity, depth),
+            QuadTree(mx, my, self.x1, self.y1, self.capacity, depth),
+        ]
+        for entry in self.entries:
+            self._child_for(entry[0], entry[1]).insert(entry[2], entry[0], entry[1])
+        self.entries = []
+
+    def insert(self, item: Any, x: float, y: float) -> None:
+        """
+        Insert an item at a point
+
+        Args:
+            item: Object to store
+            x: X coordinate
+            y: Y coordinate
+        """
+        self.size += 1
+        if self.children is not None:
+            self._child_for(x, y).insert(item, x, y)
+            return
+
+        self.entries.append((x, y, item))
+        if len(self.entries) > self.capacity and self.max_depth > 0:
+            self._split()
+
+    def remove(self, item: Any, x: float, y: float) -> bool:
+        """
+        Remove an item previously inserted at a point
+
+        Args:
+            item: Object to remove
+            x: X coordinate it was inserted at
+            y: Y coordinate it was inserted at
+
+        Returns:
+            True if the item was found and removed
+        """
+        if self.children is not None:
+            removed = self._child_for(x, y).remove(item, x, y)
+        else:
+            removed = False
+            for i, entry in enumerate(self.entries):
+                if entry[2] is item:
+                    del self.entries[i]
+                    removed = True
+                    break
+
+        if removed:
+            self.size -= 1
+            if self.children is not None and self.size <= self.capacity:
+                # Collapse back into a leaf once the subtree is small again
+                self.entries = list(self.iter_entries())
+                self.children = None
+        return removed
+
+    def iter_entries(self):
+        """Yield every (x, y, item) entry in the subtree"""
+        if self.children is None:
+            yield from self.entries
+        else:
+            for child in self.children:
+                yield from child.iter_entries()
+
+    def query_nearest(self, x: float, y: float, radius: Optional[float] = None) -> Optional[Any]:
+        """
+        Find the item nearest to a point
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            radius: Only consider items within this distance (None for no limit)
+
+        Returns:
+            Nearest item, or None if there is none in range
+        """
+        best_item = None
+        best_d2 = float('inf') if radius is None else radius * radius
+        found = False
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.size == 0:
+                continue
+
+            # Squared distance from the point to the node bounds
+            dx = max(node.x0 - x, 0, x - node.x1)
+            dy = max(node.y0 - y, 0, y - node.y1)
+            if dx * dx + dy * dy > best_d2:
+                continue
+
+            if node.children is None:
+                for ex, ey, item in node.entries:
+                    ddx = ex - x
+                    ddy = ey - y
+                    d2 = ddx * ddx + ddy * ddy
+                    if d2 < best_d2 or (d2 == best_d2 and not found):
+                        best_d2 = d2
+                        best_item = item
+                        found = True
+            else:
+                # Visit the quadrant containing the point first (pushed last)
+                near = node._child_for(x, y)
+                stack.extend(child for child in node.children if child is not near)
+                stack.append(near)
+
+        return best_item
+
+    def clear(self) -> None:
+        """Remove all items"""
+        self.entries = []
+        self.children = None
+        self.size = 0
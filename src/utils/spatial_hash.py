@@ -0,0 +1,109 @@
+"""
+Spatial Hash Grid
+Uniform grid that buckets objects by position for fast neighbourhood queries
+"""
+from typing import Any, Dict, List
+
+
+def cell_key(cx: int, cy: int) -> int:
+    """
+    Hash a grid cell coordinate pair into a single integer key
+
+    Args:
+        cx: Cell column
+        cy: Cell row
+
+    Returns:
+        Integer key (distinct cells may collide; queries tolerate extra candidates)
+    """
+    return (cx * 73856093) ^ (cy * 19349663)
+
+
+class SpatialHashGrid:
+    """Buckets objects into the grid cells their bounding boxes overlap"""
+
+    def __init__(self, cell_size: float = 64):
+        """
+        Initialize an empty grid
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[int, List[Any]] = {}
+
+    def insert(self, item: Any, x: float, y: float, width: float = 0, height: float = 0) -> None:
+        """
+        Insert an item into every cell its bounding box overlaps
+
+        Args:
+            item: Object to store
+            x: Left edge
+            y: Top edge
+            width: Bounding box width
+            height: Bounding box height
+        """
+        size = self.cell_size
+        for cx in range(int(x // size), int((x + width) // size) + 1):
+            for cy in range(int(y // size), int((y + height) // size) + 1):
+                self.cells.setdefault(cell_key(cx, cy), []).append(item)
+
+    def remove(self, item: Any, x: float, y: float) -> None:
+        """
+        Remove a point item from the cell containing its position
+
+        Args:
+            item: Object to remove
+            x: X coordinate it is stored at
+            y: Y coordinate it is stored at
+        """
+        size = self.cell_size
+        key = cell_key(int(x // size), int(y // size))
+        bucket = self.cells.get(key)
+        if bucket is not None and item in bucket:
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[key]
+
+    def query_cell(self, x: float, y: float) -> List[Any]:
+        """
+        Get the items stored in the cell containing a point
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Items in that cell
+        """
+        size = self.cell_size
+        return self.cells.get(cell_key(int(x // size), int(y // size)), [])
+
+    def query(self, x: float, y: float, radius: float = 0) -> List[Any]:
+        """
+        Get the items in all cells overlapping a circle's bounding box
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+            radius: Query radius
+
+        Returns:
+            Candidate items, each listed once
+        """
+        size = self.cell_size
+        cx0, cx1 = int((x - radius) // size), int((x + radius) // size)
+        cy0, cy1 = int((y - radius) // size), int((y + radius) // size)
+        if cx0 == cx1 and cy0 == cy1:
+            return self.cells.get(cell_key(cx0, cy0), [])
+
+        found = {}
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for item in self.cells.get(cell_key(cx, cy), ()):
+                    found[id(item)] = item
+        return list(found.values())
+
+    def clear(self) -> None:
+        """Remove all items"""
+        self.cells.clear()
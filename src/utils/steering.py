@@ -0,0 +1,102 @@
+"""
+Steering Kernel
+Numeric core of obstacle-avoiding steering, compiled with Numba when available
+"""
+import math
+from typing import Tuple
+import numpy as np
+from src.utils.jit import njit, NUMBA_AVAILABLE
+
+
+# Steering candidates, in order of preference:
+# straight ahead, widening turns, lateral strafes, then backing off
+STEER_OFFSETS = [0, 15, -15, 30, -30, 45, -45, 60, -60, 75, -75, 90, -90,
+                 120, -120, 135, -135, 150, -150, 180, 180, 180]
+STEER_SPEED_SCALES = [1.0] * 13 + [0.6] * 6 + [0.6, 0.4, 0.2]
+
+_STEER_COS = np.cos(np.radians(STEER_OFFSETS))
+_STEER_SIN = np.sin(np.radians(STEER_OFFSETS))
+_STEER_SCALES = np.array(STEER_SPEED_SCALES)
+
+
+@njit(cache=True)
+def _best_candidate_loop(cx, cy, tx, ty, speed, sign, x0, y0, x1, y1, buffer, width, height):
+    """Scalar loop version; only fast when compiled by Numba"""
+    angle = math.atan2(ty - cy, tx - cx)
+    cos_t = math.cos(angle)
+    sin_t = math.sin(angle)
+    buffer_sq = buffer * buffer
+
+    for i in range(_STEER_COS.shape[0]):
+        c = _STEER_COS[i]
+        s = _STEER_SIN[i] * sign
+        step = _STEER_SCALES[i] * speed
+        px = min(max(cx + (cos_t * c - sin_t * s) * step, 0.0), width)
+        py = min(max(cy + (sin_t * c + cos_t * s) * step, 0.0), height)
+
+        clear = True
+        for j in range(x0.shape[0]):
+            # Reject by bounding box before the exact closest-point test
+            if px + buffer < x0[j] or px - buffer > x1[j] or py + buffer < y0[j] or py - buffer > y1[j]:
+                continue
+            dx = px - min(max(px, x0[j]), x1[j])
+            dy = py - min(max(py, y0[j]), y1[j])
+            if dx * dx + dy * dy < buffer_sq:
+                clear = False
+                break
+
+        if clear:
+            return i, px, py
+
+    return -1, cx, cy
+
+
+def _best_candidate_numpy(cx, cy, tx, ty, speed, sign, x0, y0, x1, y1, buffer, width, height):
+    """Vectorized version that tests every candidate against every obstacle at once"""
+    angle = math.atan2(ty - cy, tx - cx)
+    cos_t = math.cos(angle)
+    sin_t = math.sin(angle)
+    steer_sin = _STEER_SIN * sign
+
+    steps = _STEER_SCALES * speed
+    test_x = np.clip(cx + (cos_t * _STEER_COS - sin_t * steer_sin) * steps, 0, width)
+    test_y = np.clip(cy + (sin_t * _STEER_COS + cos_t * steer_sin) * steps, 0, height)
+
+    dx = test_x[:, None] - np.clip(test_x[:, None], x0, x1)
+    dy = test_y[:, None] - np.clip(test_y[:, None], y0, y1)
+    clear = ~(dx * dx + dy * dy < buffer * buffer).any(axis=1)
+
+    if not clear.any():
+        return -1, cx, cy
+
+    best = int(np.argmax(clear))
+    return best, float(test_x[best]), float(test_y[best])
+
+
+def best_candidate(cx: float, cy: float, tx: float, ty: float, speed: float, sign: float,
+                   x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray,
+                   buffer: float, width: float, height: float) -> Tuple[int, float, float]:
+    """
+    Pick the first steering candidate that keeps a circle clear of all obstacles
+
+    Args:
+        cx, cy: Current position
+        tx, ty: Target position
+        speed: Step length
+        sign: +1 to try left turns first, -1 to try right turns first
+        x0, y0, x1, y1: Obstacle bounds as float64 arrays
+        buffer: Required clearance around the position
+        width, height: Map bounds that candidates are clamped to
+
+    Returns:
+        (candidate index, x, y), or (-1, cx, cy) if every candidate is blocked
+    """
+    if NUMBA_AVAILABLE:
+        return _best_candidate_loop(cx, cy, tx, ty, speed, sign, x0, y0, x1, y1, buffer, width, height)
+    return _best_candidate_numpy(cx, cy, tx, ty, speed, sign, x0, y0, x1, y1, buffer, width, height)
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import, not on the first blocked step mid-game
+    _best_candidate_loop(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, np.empty(0), np.empty(0), np.empty(0), np.empty(0),
+                         1.0, 1.0, 1.0)
@@ -0,0 +1,49 @@
+"""Tests for the segment-rectangle and line-of-sight helpers"""
+import pytest
+
+from src.utils.helpers import line_intersects_rect, line_of_sight
+
+
+# Rectangle spanning x 10..20, y 10..20, as (x, y, width, height)
+RECT = (10, 10, 10, 10)
+
+
+@pytest.mark.parametrize("p1, p2, expected", [
+    ((0, 0), (30, 30), True),     # Diagonal straight through
+    ((0, 15), (15, 30), False),   # Diagonal passing beside the top-left corner
+    ((30, 15), (15, 30), False),  # Diagonal passing beside the bottom-right corner
+    ((5, 15), (20, 30), True),    # Diagonal clipping the corner exactly
+    ((0, 15), (5, 15), False),    # Ends before the rectangle
+])
+def test_diagonal_and_short_segments(p1, p2, expected):
+    """Test segments whose bounding box overlaps or nearly overlaps the rectangle"""
+    assert line_intersects_rect(p1, p2, RECT) is expected
+
+
+@pytest.mark.parametrize("point, expected", [
+    ((15, 15), True),   # Inside
+    ((10, 15), True),   # On an edge
+    ((5, 5), False),    # Outside
+])
+def test_degenerate_point_segment(point, expected):
+    """Test a zero-length segment"""
+    assert line_intersects_rect(point, point, RECT) is expected
+
+
+@pytest.mark.parametrize("p1, p2, expected", [
+    ((0, 15), (30, 15), True),    # Horizontal, through the middle
+    ((0, 10), (30, 10), True),    # Horizontal, along the top edge
+    ((0, 5), (30, 5), False),     # Horizontal, above the rectangle
+    ((15, 0), (15, 30), True),    # Vertical, through the middle
+    ((25, 0), (25, 30), False),   # Vertical, right of the rectangle
+])
+def test_segment_parallel_to_edge(p1, p2, expected):
+    """Test axis-parallel segments"""
+    assert line_intersects_rect(p1, p2, RECT) is expected
+
+
+def test_line_of_sight():
+    """Test that line of sight respects both range and obstacles"""
+    assert line_of_sight((0, 15), (15, 30), [RECT], 100)
+    assert not line_of_sight((0, 0), (30, 30), [RECT], 100)
+    assert not line_of_sight((0, 15), (15, 30), [], 10)
@@ -1,9 +1,10 @@
 """
 Test Mesa Framework Integration
-Run this to verify Mesa is properly installed and working
+Run with pytest (or directly) to verify Mesa is properly installed and working
 """
 import sys
 import os
+import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,100 +12,34 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.mesa_model import create_game_model, OperationGuardianModel
 
 
+@pytest.fixture(scope="module", params=["easy", "medium", "hard"])
+def model(request):
+    """One game model per difficulty, shared by the tests in this module"""
+    return create_game_model(request.param)
+
+
 def test_mesa_installation():
     """Test that Mesa is installed"""
-    try:
-        import mesa
-        print(f"✓ Mesa {mesa.__version__} installed successfully!")
-        return True
-    except ImportError as e:
-        print(f"✗ Mesa installation failed: {e}")
-        return False
+    mesa = pytest.importorskip("mesa")
+    assert mesa.__version__
 
 
-def test_model_creation():
+def test_model_creation(model):
     """Test creating a Mesa model"""
-    try:
-        model = create_game_model("easy")
-        assert model is not None
-        assert isinstance(model, OperationGuardianModel)
-        print("✓ Model creation successful")
-        return True
-    except Exception as e:
-        print(f"✗ Model creation failed: {e}")
-        return False
+    assert model is not None
+    assert isinstance(model, OperationGuardianModel)
 
 
-def test_scheduler():
+def test_scheduler(model):
     """Test scheduler functionality"""
-    try:
-        model = create_game_model("medium")
-        assert model.scheduler is not None
-        print(f"✓ Scheduler created successfully")
-        return True
-    except Exception as e:
-        print(f"✗ Scheduler creation failed: {e}")
-        return False
+    assert model.scheduler is not None
 
 
-def test_game_state():
+def test_game_state(model):
     """Test getting game state"""
-    try:
-        model = create_game_model("hard")
-        state = model.get_game_state()
-        assert isinstance(state, dict)
-        print(f"✓ Game state retrieval successful")
-        print(f"  - Difficulty: {state.get('difficulty')}")
-        print(f"  - Step count: {state.get('step')}")
-        return True
-    except Exception as e:
-        print(f"✗ Game state retrieval failed: {e}")
-        return False
-
-
-def main():
-    """Run all tests"""
-    print("=" * 50)
-    print("Mesa Framework Integration Tests")
-    print("=" * 50)
-    
-    tests = [
-        ("Mesa Installation", test_mesa_installation),
-        ("Model Creation", test_model_creation),
-        ("Scheduler", test_scheduler),
-        ("Game State", test_game_state),
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        print(f"\nTesting {test_name}...")
-        result = test_func()
-        results.append((test_name, result))
-    
-    print("\n" + "=" * 50)
-    print("Test Results")
-    print("=" * 50)
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status}: {test_name}")
-    
-    print(f"\nTotal: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("\n✅ All Mesa integration tests passed!")
-        print("\nNext steps:")
-        print("1. Read MESA_QUICK_START.md for overview")
-        print("2. Read MESA_OVERVIEW.md for concepts")
-        print("3. Read MESA_IMPLEMENTATION_GUIDE.md for detailed steps")
-        return 0
-    else:
-        print("\n⚠️  Some tests failed. Please review above.")
-        return 1
+    state = model.get_game_state()
+    assert isinstance(state, dict)
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,80 @@
+"""Tests for the point quadtree's nearest-neighbour queries"""
+import math
+import random
+import pytest
+
+from src.utils.quadtree import QuadTree
+
+
+def brute_nearest(points, x, y, radius=None):
+    """Nearest (item, x, y) entry by linear scan, or None if none is in range"""
+    best = None
+    best_d = math.inf if radius is None else radius
+    for entry in points:
+        d = math.hypot(entry[1] - x, entry[2] - y)
+        if d <= best_d:
+            best, best_d = entry, d
+    return best
+
+
+def nearest_distance(points, item, x, y):
+    """Distance from a point to where an item was inserted"""
+    _, px, py = points[item]
+    return math.hypot(px - x, py - y)
+
+
+@pytest.fixture
+def tree_and_points():
+    """A tree over 200 random points, deep enough to have split many times"""
+    rng = random.Random(1234)
+    tree = QuadTree(0, 0, 1000, 800)
+    points = []
+    for i in range(200):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 800)
+        tree.insert(i, x, y)
+        points.append((i, x, y))
+    return tree, points
+
+
+def test_query_nearest_matches_brute_force(tree_and_points):
+    """Test unbounded nearest queries against a linear scan"""
+    tree, points = tree_and_points
+    rng = random.Random(99)
+    for _ in range(100):
+        x, y = rng.uniform(-50, 1050), rng.uniform(-50, 850)
+        found = tree.query_nearest(x, y)
+        expected = brute_nearest(points, x, y)
+        # Compare distances so exact ties can't make the test flaky
+        assert nearest_distance(points, found, x, y) == pytest.approx(
+            nearest_distance(points, expected[0], x, y))
+
+
+def test_query_nearest_with_radius(tree_and_points):
+    """Test that a radius limits the search and returns None when nothing is in range"""
+    tree, points = tree_and_points
+    rng = random.Random(7)
+    for _ in range(100):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 800)
+        found = tree.query_nearest(x, y, radius=40)
+        expected = brute_nearest(points, x, y, radius=40)
+        if expected is None:
+            assert found is None
+        else:
+            assert nearest_distance(points, found, x, y) == pytest.approx(
+                nearest_distance(points, expected[0], x, y))
+
+
+def test_query_nearest_after_remove(tree_and_points):
+    """Test that removed items are never returned"""
+    tree, points = tree_and_points
+    _, x, y = points[0]
+    assert tree.query_nearest(x, y) == 0
+
+    assert tree.remove(0, x, y)
+    assert tree.query_nearest(x, y) != 0
+    assert not tree.remove(0, x, y)
+
+
+def test_empty_tree():
+    """Test that an empty tree finds nothing"""
+    assert QuadTree(0, 0, 100, 100).query_nearest(50, 50) is None
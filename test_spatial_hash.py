@@ -0,0 +1,47 @@
+"""Tests for the spatial hash grid"""
+from src.utils.spatial_hash import SpatialHashGrid
+
+
+def test_point_insert_and_query():
+    """Test that a query finds nearby points and skips far ones"""
+    grid = SpatialHashGrid(64)
+    grid.insert("near", 10, 10)
+    grid.insert("far", 500, 500)
+
+    assert grid.query(20, 20, 30) == ["near"]
+    assert grid.query_cell(10, 10) == ["near"]
+    assert grid.query(300, 300, 10) == []
+
+
+def test_box_spanning_cells_listed_once():
+    """Test that an item in several cells comes back once from a wide query"""
+    grid = SpatialHashGrid(64)
+    grid.insert("wall", 0, 0, 200, 10)
+
+    assert grid.query_cell(150, 5) == ["wall"]
+    assert grid.query(100, 5, 100) == ["wall"]
+
+
+def test_remove():
+    """Test that a removed point is gone and its empty cell is dropped"""
+    grid = SpatialHashGrid(64)
+    grid.insert("a", 10, 10)
+    grid.insert("b", 20, 20)
+
+    grid.remove("a", 10, 10)
+    assert grid.query(15, 15, 10) == ["b"]
+
+    grid.remove("b", 20, 20)
+    assert grid.cells == {}
+
+    grid.remove("b", 20, 20)  # Removing again is a no-op
+
+
+def test_negative_coordinates():
+    """Test that cells left of and above the origin don't collide with others"""
+    grid = SpatialHashGrid(64)
+    grid.insert("left", -10, 10)
+    grid.insert("right", 10, 10)
+
+    assert grid.query_cell(-10, 10) == ["left"]
+    assert grid.query_cell(10, 10) == ["right"]
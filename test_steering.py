@@ -0,0 +1,66 @@
+"""Tests for the steering kernel and its two implementations"""
+import random
+import numpy as np
+import pytest
+
+from src.utils.steering import (STEER_OFFSETS, best_candidate,
+                                _best_candidate_loop, _best_candidate_numpy)
+
+
+WIDTH, HEIGHT = 1000, 800
+SPEED = 4.0
+BUFFER = 30.0
+
+
+def bounds(*rects):
+    """Obstacle bounds arrays (x0, y0, x1, y1) from (x, y, width, height) tuples"""
+    arr = np.array([(x, y, x + w, y + h) for x, y, w, h in rects], dtype=np.float64).reshape(-1, 4)
+    return arr[:, 0].copy(), arr[:, 1].copy(), arr[:, 2].copy(), arr[:, 3].copy()
+
+
+def test_clear_path_goes_straight():
+    """Test that with nothing in the way the first candidate is a full step at the target"""
+    best, x, y = best_candidate(100.0, 100.0, 200.0, 100.0, SPEED, 1.0, *bounds(),
+                                BUFFER, WIDTH, HEIGHT)
+    assert best == 0
+    assert (x, y) == pytest.approx((100.0 + SPEED, 100.0))
+
+
+def test_wall_ahead_turns_aside():
+    """Test that a wall just ahead skips to the first clear turn, on the preferred side"""
+    wall = bounds((131, 0, 20, 200))  # 31px ahead: any forward step breaks the 30px buffer
+    for sign in (1.0, -1.0):
+        best, x, y = best_candidate(100.0, 100.0, 300.0, 100.0, SPEED, sign, *wall,
+                                    BUFFER, WIDTH, HEIGHT)
+        assert best == STEER_OFFSETS.index(90)
+        assert (x, y) == pytest.approx((100.0, 100.0 + sign * SPEED))
+
+
+def test_fully_blocked_stays_put():
+    """Test that when every candidate is blocked the position is returned unchanged"""
+    box = bounds((50, 50, 100, 100))
+    assert best_candidate(100.0, 100.0, 300.0, 100.0, SPEED, 1.0, *box,
+                          BUFFER, WIDTH, HEIGHT) == (-1, 100.0, 100.0)
+
+
+def test_candidates_clamped_to_map():
+    """Test that candidates never leave the map"""
+    best, x, y = best_candidate(0.0, 0.0, -100.0, -100.0, SPEED, 1.0, *bounds(),
+                                BUFFER, WIDTH, HEIGHT)
+    assert best == 0
+    assert (x, y) == (0.0, 0.0)
+
+
+def test_loop_and_numpy_versions_agree():
+    """Test that the Numba loop and the NumPy version pick the same candidate"""
+    rng = random.Random(5)
+    rects = [(rng.uniform(0, 900), rng.uniform(0, 700), rng.uniform(20, 100), rng.uniform(20, 100))
+             for _ in range(12)]
+    obs = bounds(*rects)
+    for _ in range(200):
+        args = (rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT),
+                rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT),
+                SPEED, rng.choice((1.0, -1.0)), *obs, BUFFER, float(WIDTH), float(HEIGHT))
+        loop_best, loop_x, loop_y = _best_candidate_loop(*args)
+        numpy_best, numpy_x, numpy_y = _best_candidate_numpy(*args)
+        assert (loop_best, loop_x, loop_y) == (numpy_best, numpy_x, numpy_y)